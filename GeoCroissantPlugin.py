@@ -12,12 +12,44 @@
 """
 
 import os.path
+from typing import Optional
 
 from qgis.gui import QgisInterface
 from qgis.core import QgsSettings
-from qgis.PyQt.QtCore import QTranslator, qVersion, QCoreApplication, QLocale
+from qgis.PyQt.QtCore import QTranslator, QCoreApplication, QLocale
 
-from .gui import GeoCroissantDialogMain
+_PLUGIN_DIR = os.path.dirname(os.path.abspath(__file__))
+_I18N_DIR = os.path.join(_PLUGIN_DIR, "i18n")
+
+# Installed once per session so plugin reloads don't stack translators
+_translator: Optional[QTranslator] = None
+
+
+def _install_translator() -> Optional[QTranslator]:
+    """
+    Install the translator for the user's locale, if one is available.
+
+    :returns: The installed QTranslator or None
+    """
+    global _translator
+    if _translator is not None:
+        return _translator
+
+    locale = QgsSettings().value("locale/userLocale") or QLocale().name()
+    if not isinstance(locale, str) or not locale:
+        return None
+
+    locale_path = os.path.join(_I18N_DIR, f"geocroissant_{locale[0:2]}.qm")
+    if not os.path.exists(locale_path):
+        return None
+
+    translator = QTranslator()
+    translator.load(locale_path)
+
+    QCoreApplication.installTranslator(translator)
+
+    _translator = translator
+    return _translator
 
 
 class GeoCroissantTools:
@@ -30,31 +62,17 @@ class GeoCroissantTools:
             manipulate the QGIS application at run time.
         :type iface: QgsInterface
         """
+        # Deferred so the dialog module is only imported once QGIS builds the plugin
+        from .gui import GeoCroissantDialogMain
+
         self.iface = iface
         self.dialog = GeoCroissantDialogMain(iface)
 
         # Initialize plugin directory
-        self.plugin_dir = os.path.dirname(__file__)
+        self.plugin_dir = _PLUGIN_DIR
 
         # Initialize locale
-        try:
-            locale = QgsSettings().value("locale/userLocale")
-            if not locale:
-                locale = QLocale().name()
-            locale = locale[0:2]
-
-            locale_path = os.path.join(
-                self.plugin_dir, "i18n", f"geocroissant_{locale}.qm"
-            )
-
-            if os.path.exists(locale_path):
-                self.translator = QTranslator()
-                self.translator.load(locale_path)
-
-                if qVersion() > "4.3.3":
-                    QCoreApplication.installTranslator(self.translator)
-        except TypeError:
-            pass
+        self.translator = _install_translator()
 
     def initGui(self) -> None:
         """Create the menu entries and toolbar icons inside the QGIS GUI."""
@@ -50,12 +50,30 @@ BBOX_COLOR = "#FF5722"
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 RESOURCE_PREFIX = ":plugins/GeoCroissantTools/img/"
 
-# Read metadata.txt
-METADATA = configparser.ConfigParser()
-METADATA.read(os.path.join(BASE_DIR, "metadata.txt"), encoding="utf-8")
-
-__version__ = METADATA["general"]["version"]
-__author__ = METADATA["general"]["author"]
-__email__ = METADATA["general"]["email"]
-__web__ = METADATA["general"]["homepage"]
-__help__ = METADATA["general"]["help"]
+# metadata.txt keys exposed as module attributes, read on first access
+_METADATA_KEYS = {
+    "__version__": "version",
+    "__author__": "author",
+    "__email__": "email",
+    "__web__": "homepage",
+    "__help__": "help",
+}
+_metadata = None
+
+
+def _get_metadata() -> configparser.ConfigParser:
+    """Read metadata.txt once and return the parsed contents."""
+    global _metadata
+    if _metadata is None:
+        _metadata = configparser.ConfigParser()
+        _metadata.read(os.path.join(BASE_DIR, "metadata.txt"), encoding="utf-8")
+    return _metadata
+
+
+def __getattr__(name: str):
+    """Lazily resolve METADATA and the metadata-derived dunder attributes."""
+    if name == "METADATA":
+        return _get_metadata()
+    if name in _METADATA_KEYS:
+        return _get_metadata()["general"][_METADATA_KEYS[name]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
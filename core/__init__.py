@@ -5,7 +5,13 @@ Core module for GeoCroissant Tools plugin.
 
 from .geocroissant_parser import GeoCroissantParser
 from .layer_builder import TileLayerBuilder, BboxLayerBuilder
-from .data_loader import COGLoader, CSVLoader
+from .data_loader import (
+    COGLoader,
+    CSVLoader,
+    GeoPackageLoader,
+    MosaicLoader,
+    NetCDFLoader,
+)
 
 __all__ = [
     "GeoCroissantParser",
@@ -13,4 +19,7 @@ __all__ = [
     "BboxLayerBuilder",
     "COGLoader",
     "CSVLoader",
+    "GeoPackageLoader",
+    "MosaicLoader",
+    "NetCDFLoader",
 ]
@@ -6,17 +6,419 @@ Loads raster (COG) and vector (CSV) data from various sources
 including S3, HTTP, and local files.
 """
 
-from typing import Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+import atexit
+import codecs
+import csv
+import hashlib
+import io
 import re
 import os
+import shutil
 import tempfile
+import threading
+import time
 import urllib.request
+from urllib.parse import quote
 
 from qgis.core import (
+    QgsApplication,
+    QgsProject,
     QgsRasterLayer,
     QgsVectorLayer,
 )
 
+# Remote URL schemes and their GDAL virtual filesystem prefixes
+_SCHEME_MAP = {
+    "s3://": "/vsis3/",
+    "gs://": "/vsigs/",
+    "az://": "/vsiaz/",
+    "abfs://": "/vsiaz/",
+    "http://": "/vsicurl/http://",
+    "https://": "/vsicurl/https://",
+}
+_SCHEMES = tuple(_SCHEME_MAP)
+
+# Bucket and key of an s3:// URL
+_S3_RE = re.compile(r"s3://([^/]+)/(.+)")
+
+# Column names recognized as point coordinates in CSV headers
+_X_FIELDS = frozenset({"longitude", "lon", "lng", "x", "long"})
+_Y_FIELDS = frozenset({"latitude", "lat", "y"})
+
+# Bytes read from a CSV file to detect its delimiter, header and encoding
+_SNIFF_SIZE = 4096
+
+# Download tuning: stream in 1 MiB chunks, split large files into ranges
+_CHUNK_SIZE = 1 << 20
+_PARALLEL_MIN_SIZE = 8 * _CHUNK_SIZE
+_MAX_CONNECTIONS = 8
+
+
+# Downloaded files reused across loaders, keyed by URL (LRU order)
+_DOWNLOAD_TTL = 3600
+_DOWNLOAD_CACHE_MAX_BYTES = 2 << 30
+_download_cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+# Guards _download_cache; downloads run from loader tasks and thread pools
+_download_lock = threading.Lock()
+
+# Per-user directory holding downloads, resolved on first use
+_cache_path: Optional[str] = None
+
+
+def _cache_dir() -> str:
+    """
+    Get the per-user cache directory, creating it on first use.
+
+    The directory lives in the QGIS profile so other users can't plant or
+    replace cached files. Without a usable profile a private temp directory
+    is created for this session instead.
+
+    :returns: Cache directory path
+    """
+    global _cache_path
+    with _download_lock:
+        if _cache_path is None:
+            settings_dir = QgsApplication.qgisSettingsDirPath()
+            path = os.path.join(settings_dir, "cache", "geocroissant")
+            try:
+                if not settings_dir:
+                    raise OSError("no QGIS settings directory")
+                os.makedirs(path, mode=0o700, exist_ok=True)
+            except OSError:
+                path = tempfile.mkdtemp(prefix="gctools_")
+            _cache_path = path
+        return _cache_path
+
+
+def _cached_download(url: str, suffix: str = ".dat", ttl: float = _DOWNLOAD_TTL) -> str:
+    """
+    Download a remote file once and reuse the local copy while it is fresh.
+
+    Files are stored in the per-user cache directory under a name derived
+    from the URL hash, so a copy downloaded in an earlier session is reused
+    too.
+    The returned file is owned by the cache; callers must not delete it.
+
+    :param url: URL to download from
+    :param suffix: File extension for the local copy
+    :param ttl: Seconds a downloaded copy stays valid
+    :returns: Local file path
+    """
+    path, fresh = _download_target(url, suffix, ttl)
+
+    if not fresh:
+        part_path = _part_path(path)
+        try:
+            _parallel_download(_download_url(url), part_path)
+            os.replace(part_path, path)
+        finally:
+            if os.path.exists(part_path):
+                os.unlink(part_path)
+
+    _register_download(url, path)
+    return path
+
+
+def _download_target(url: str, suffix: str, ttl: float) -> Tuple[str, bool]:
+    """
+    Get the cache path of a URL and whether the copy there is still fresh.
+
+    :param url: URL to download from
+    :param suffix: File extension for the local copy
+    :param ttl: Seconds a downloaded copy stays valid
+    :returns: Tuple of (local path, fresh)
+    """
+    digest = hashlib.blake2b(url.encode("utf-8"), digest_size=8).hexdigest()
+    path = os.path.join(_cache_dir(), f"gctools_{digest}{suffix}")
+
+    try:
+        fresh = time.time() - os.path.getmtime(path) < ttl
+    except OSError:
+        fresh = False
+    return path, fresh
+
+
+def _part_path(path: str) -> str:
+    """
+    Create a unique partial-download file next to a cache path.
+
+    Transfers land next to the target so a failed one is never reused, and
+    each gets its own name so concurrent loads of one URL don't clash.
+
+    :param path: Final cache path
+    :returns: Path of the new, empty part file
+    """
+    base = os.path.basename(path)
+    fd, part_path = tempfile.mkstemp(
+        prefix=f"{base}.", suffix=".part", dir=os.path.dirname(path)
+    )
+    os.close(fd)
+    return part_path
+
+
+def _register_download(url: str, path: str) -> None:
+    """
+    Record a fresh download as most recently used.
+
+    :param url: Downloaded URL
+    :param path: Local cache path
+    """
+    with _download_lock:
+        _download_cache[url] = (path, time.time())
+        _download_cache.move_to_end(url)
+
+
+def _evict_downloads(keep: str) -> None:
+    """
+    Delete least recently used downloads beyond the cache size limit.
+
+    Downloads that still back a layer of the current project are kept.
+    This reads the project's layers, so call it from the main thread.
+
+    :param keep: Source of a layer being created that isn't in the project yet
+    """
+    sources = [layer.source() for layer in QgsProject.instance().mapLayers().values()]
+    sources.append(keep)
+
+    with _download_lock:
+        sizes = {}
+        for url, (path, _) in _download_cache.items():
+            try:
+                sizes[url] = os.path.getsize(path)
+            except OSError:
+                sizes[url] = 0
+
+        total = sum(sizes.values())
+        for url, (path, _) in list(_download_cache.items()):
+            if total <= _DOWNLOAD_CACHE_MAX_BYTES:
+                break
+            # Cache file names are unique, so a match on the name is enough
+            # whatever form the provider URI gives the path in
+            name = os.path.basename(path)
+            if any(name in source for source in sources):
+                continue
+            del _download_cache[url]
+            total -= sizes[url]
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+@atexit.register
+def _cleanup_downloads() -> None:
+    """Delete cached downloads that have outlived their TTL."""
+    now = time.time()
+    with _download_lock:
+        entries = list(_download_cache.values())
+    for path, timestamp in entries:
+        if now - timestamp >= _DOWNLOAD_TTL:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+def _download_url(url: str) -> str:
+    """
+    Convert an s3:// URL to its public HTTPS form for plain downloads.
+
+    :param url: Original URL
+    :returns: Downloadable URL
+    """
+    bucket_match = _S3_RE.match(url)
+    if bucket_match:
+        bucket = bucket_match.group(1)
+        path = bucket_match.group(2)
+        return f"https://{bucket}.s3.amazonaws.com/{path}"
+    return url
+
+
+def _download_range(url: str, out_path: str, start: int, end: int) -> None:
+    """
+    Download one byte range of a remote file into place.
+
+    :param url: URL to download from
+    :param out_path: Preallocated destination file
+    :param start: First byte of the range
+    :param end: Last byte of the range (inclusive)
+    """
+    request = urllib.request.Request(url, headers={"Range": f"bytes={start}-{end}"})
+    with urllib.request.urlopen(request) as resp:
+        if resp.status != 206:
+            raise IOError(f"Server ignored range request for {url}")
+        with open(out_path, "r+b") as f:
+            f.seek(start)
+            shutil.copyfileobj(resp, f, length=_CHUNK_SIZE)
+
+
+def _parallel_download(url: str, out_path: str, chunks: int = 6) -> None:
+    """
+    Download a remote file, splitting it into parallel range requests.
+
+    Large files on servers that accept ``Range`` requests are fetched in
+    ``chunks`` concurrent parts; everything else is streamed in one request.
+
+    :param url: URL to download from
+    :param out_path: Destination file path
+    :param chunks: Number of concurrent range requests
+    """
+    size = 0
+    try:
+        request = urllib.request.Request(url, method="HEAD")
+        with urllib.request.urlopen(request) as resp:
+            if resp.headers.get("Accept-Ranges", "").lower() == "bytes":
+                size = int(resp.headers.get("Content-Length") or 0)
+    except Exception:
+        size = 0
+
+    if size >= _PARALLEL_MIN_SIZE:
+        try:
+            with open(out_path, "wb") as f:
+                f.truncate(size)
+
+            part = -(-size // chunks)
+            ranges = [
+                (start, min(start + part, size) - 1) for start in range(0, size, part)
+            ]
+            with ThreadPoolExecutor(max_workers=chunks) as pool:
+                futures = [
+                    pool.submit(_download_range, url, out_path, start, end)
+                    for start, end in ranges
+                ]
+                for future in futures:
+                    future.result()
+            return
+        except Exception:
+            # Fall back to a single streamed request
+            pass
+
+    with urllib.request.urlopen(url) as resp, open(out_path, "wb") as f:
+        shutil.copyfileobj(resp, f, length=_CHUNK_SIZE)
+
+
+# Session-wide GDAL cache and HTTP options for remote rasters; user-set
+# values are left untouched
+_VSICURL_OPTIONS = {
+    "CPL_VSIL_CURL_CACHE_SIZE": "268435456",
+    "VSI_CACHE": "TRUE",
+    "VSI_CACHE_SIZE": "134217728",
+    "GDAL_HTTP_VERSION": "2",
+    "GDAL_HTTP_MULTIPLEX": "YES",
+}
+_vsicurl_configured = False
+
+# GDAL options applied only while the plugin opens a remote raster; as
+# session-wide settings they would disable sidecar (.aux.xml, .ovr, world
+# file) detection for every dataset the user opens
+_REMOTE_OPEN_OPTIONS = {
+    "CPL_VSIL_CURL_USE_HEAD": "NO",
+    "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+}
+
+
+def _configure_vsicurl() -> None:
+    """
+    Tune GDAL's /vsicurl/ handler for repeated remote reads.
+
+    Enlarges the block caches so reopened tiles are served from memory and
+    enables HTTP/2 multiplexing so range requests share one connection.
+    Runs once per session.
+    """
+    global _vsicurl_configured
+    if _vsicurl_configured:
+        return
+    _vsicurl_configured = True
+
+    try:
+        from osgeo import gdal
+    except ImportError:
+        return
+
+    for key, value in _VSICURL_OPTIONS.items():
+        if gdal.GetConfigOption(key) is None:
+            gdal.SetConfigOption(key, value)
+
+
+@contextmanager
+def _remote_open_options(remote: bool = True) -> Iterator[None]:
+    """
+    Skip the HEAD request and directory listing while opening a remote file.
+
+    Options are set thread-locally where GDAL supports it and restored on
+    exit; options the user already set are left untouched.
+
+    :param remote: Whether the path being opened is remote; if False the
+        context does nothing
+    """
+    try:
+        from osgeo import gdal
+    except ImportError:
+        gdal = None
+
+    if not remote or gdal is None:
+        yield
+        return
+
+    set_option = getattr(gdal, "SetThreadLocalConfigOption", gdal.SetConfigOption)
+    get_option = getattr(gdal, "GetThreadLocalConfigOption", gdal.GetConfigOption)
+
+    previous = {}
+    for key, value in _REMOTE_OPEN_OPTIONS.items():
+        if gdal.GetConfigOption(key) is None:
+            previous[key] = get_option(key)
+            set_option(key, value)
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            set_option(key, value)
+
+
+def _first_openable(paths: List[str]) -> Optional[str]:
+    """
+    Return the first path GDAL can open as a raster.
+
+    Without the GDAL Python bindings the first path is returned unprobed.
+
+    :param paths: Candidate GDAL paths
+    :returns: First openable path, or None if none opens
+    """
+    try:
+        from osgeo import gdal
+    except ImportError:
+        return paths[0] if paths else None
+
+    for path in paths:
+        try:
+            if gdal.OpenEx(path, gdal.OF_RASTER) is not None:
+                return path
+        except RuntimeError:
+            # Raised instead of returning None when gdal.UseExceptions() is on
+            continue
+    return None
+
+
+def _is_netcdf_file(path: str) -> bool:
+    """
+    Check a local file's magic bytes for NetCDF classic or NetCDF-4 (HDF5).
+
+    :param path: Local file path
+    :returns: True if the file looks like NetCDF, False if not or unreadable
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(8)
+    except OSError:
+        return False
+
+    return head[:3] == b"CDF" or head[:4] == b"\x89HDF"
+
 
 class COGLoader:
     """
@@ -28,6 +430,8 @@ class COGLoader:
     - Local file paths
     """
 
+    __slots__ = ("original_url", "url", "layer_name")
+
     def __init__(self, url: str, layer_name: str = "COG") -> None:
         """
         Initialize the COG loader.
@@ -39,6 +443,9 @@ class COGLoader:
         self.url = self._convert_url(url)
         self.layer_name = layer_name
 
+        if self.url.startswith("/vsi"):
+            _configure_vsicurl()
+
     def _convert_url(self, url: str) -> str:
         """
         Convert URL to GDAL-compatible virtual filesystem path.
@@ -46,58 +453,147 @@ class COGLoader:
         :param url: Original URL
         :returns: GDAL virtual filesystem path
         """
-        if url.startswith("s3://"):
-            # Convert s3://bucket/path to /vsis3/bucket/path
-            return url.replace("s3://", "/vsis3/")
-
-        elif url.startswith("http://") or url.startswith("https://"):
-            # Use /vsicurl/ for HTTP(S) URLs
-            return f"/vsicurl/{url}"
-
-        elif url.startswith("gs://"):
-            # Google Cloud Storage
-            return url.replace("gs://", "/vsigs/")
-
-        elif url.startswith("az://") or url.startswith("abfs://"):
-            # Azure Blob Storage
-            return url.replace("az://", "/vsiaz/").replace("abfs://", "/vsiaz/")
-
-        else:
+        if not url.startswith(_SCHEMES):
             # Assume local file path
             return url
 
+        for scheme, vsi_prefix in _SCHEME_MAP.items():
+            if url.startswith(scheme):
+                return vsi_prefix + url[len(scheme) :]
+
+        return url
+
     def load(self) -> Optional[QgsRasterLayer]:
         """
         Load the COG as a raster layer.
 
         :returns: QgsRasterLayer or None if loading fails
         """
-        layer = QgsRasterLayer(self.url, self.layer_name)
+        path = self.prepare()
+        return self.create_layer(path) if path else None
 
-        if layer.isValid():
-            return layer
+    def prepare(self) -> Optional[str]:
+        """
+        Find a path GDAL can open, probing remote fallbacks.
+
+        Creates no Qt objects, so it can run on a worker thread.
+
+        :returns: GDAL path to open, or None if no candidate opens
+        """
+        candidates = [self.url]
 
         # Try alternative URL formats
         if self.original_url.startswith("s3://"):
             # Try as public S3 URL
-            bucket_match = re.match(r"s3://([^/]+)/(.+)", self.original_url)
+            bucket_match = _S3_RE.match(self.original_url)
             if bucket_match:
                 bucket = bucket_match.group(1)
                 path = bucket_match.group(2)
                 public_url = f"https://{bucket}.s3.amazonaws.com/{path}"
-                alt_url = f"/vsicurl/{public_url}"
+                candidates.append(f"/vsicurl/{public_url}")
 
-                layer = QgsRasterLayer(alt_url, self.layer_name)
-                if layer.isValid():
-                    return layer
+        with _remote_open_options(self.url.startswith("/vsi")):
+            return _first_openable(candidates)
 
-        return None
+    def create_layer(self, path: str) -> Optional[QgsRasterLayer]:
+        """
+        Create the raster layer for a path returned by prepare().
+
+        Must run on the main thread.
+
+        :param path: GDAL path to open
+        :returns: QgsRasterLayer or None if the layer is invalid
+        """
+        with _remote_open_options(path.startswith("/vsi")):
+            layer = QgsRasterLayer(path, self.layer_name)
+        return layer if layer.isValid() else None
 
     def get_gdal_path(self) -> str:
         """Get the GDAL virtual filesystem path."""
         return self.url
 
 
+class MosaicLoader:
+    """
+    Loads several COGs as a single VRT mosaic.
+
+    One layer shares header reads and GDAL's block cache across all tiles
+    instead of opening a separate layer per tile. The VRT is written to the
+    per-user cache directory, so the layer and saved projects keep working
+    after the plugin is unloaded.
+    """
+
+    def __init__(self, urls: List[str], layer_name: str = "Mosaic") -> None:
+        """
+        Initialize mosaic loader.
+
+        :param urls: URLs or paths to the COG files
+        :param layer_name: Name for the loaded layer
+        """
+        self.paths = [COGLoader(url).url for url in urls]
+        self.layer_name = layer_name
+        self.remote = any(path.startswith("/vsi") for path in self.paths)
+        self.tile_count = 0
+
+    def load(self) -> Optional[QgsRasterLayer]:
+        """
+        Build the mosaic and load it as a raster layer.
+
+        :returns: QgsRasterLayer or None if loading fails
+        """
+        path = self.prepare()
+        return self.create_layer(path) if path else None
+
+    def prepare(self) -> Optional[str]:
+        """
+        Write the VRT mosaic file. Safe to call off the main thread.
+
+        BuildVRT skips sources it can't open or that don't match the others
+        (CRS, band count), so tile_count is set to the number of tiles the
+        mosaic actually references.
+
+        :returns: Path to the VRT file or None if no tile could be used
+        """
+        from osgeo import gdal
+
+        key = "\n".join(self.paths).encode("utf-8")
+        digest = hashlib.blake2b(key, digest_size=8).hexdigest()
+        vrt_path = os.path.join(_cache_dir(), f"gctools_mosaic_{digest}.vrt")
+
+        # Build next to the target and swap it in, so a layer already using
+        # the same mosaic never reads a half-written file
+        part_path = _part_path(vrt_path)
+        try:
+            with _remote_open_options(self.remote):
+                ds = gdal.BuildVRT(part_path, self.paths, resolution="highest")
+                if ds is None:
+                    return None
+                self.tile_count = len(set(ds.GetFileList() or []) & set(self.paths))
+                # Closing the dataset writes the VRT to disk
+                ds = None
+            if not self.tile_count:
+                return None
+            os.replace(part_path, vrt_path)
+        finally:
+            if os.path.exists(part_path):
+                os.unlink(part_path)
+
+        return vrt_path
+
+    def create_layer(self, path: str) -> Optional[QgsRasterLayer]:
+        """
+        Create the raster layer for a VRT returned by prepare().
+
+        Must run on the main thread.
+
+        :param path: Path to the VRT file
+        :returns: QgsRasterLayer or None if the layer is invalid
+        """
+        with _remote_open_options(self.remote):
+            layer = QgsRasterLayer(path, self.layer_name)
+        return layer if layer.isValid() else None
+
+
 class CSVLoader:
     """
     Loads CSV files as point vector layers using OGR driver.
@@ -108,6 +604,8 @@ class CSVLoader:
     - Local file paths
     """
 
+    __slots__ = ("original_url", "layer_name", "x_field", "y_field", "crs")
+
     def __init__(
         self,
         url: str,
@@ -131,74 +629,163 @@ class CSVLoader:
         self.y_field = y_field
         self.crs = crs
 
-    def _download_file(self, url: str) -> Optional[str]:
+    @staticmethod
+    def _download_file(url: str, suffix: str = ".csv") -> Optional[str]:
         """
-        Download a remote file to a temporary location.
+        Download a remote file to the shared download cache.
 
         :param url: URL to download from
-        :returns: Path to temporary file or None if download fails
+        :param suffix: File extension for the local copy
+        :returns: Path to the cached file or None if download fails
         """
         try:
-            if url.startswith("s3://"):
-                # Convert s3:// to HTTPS for download
-                bucket_match = re.match(r"s3://([^/]+)/(.+)", url)
-                if bucket_match:
-                    bucket = bucket_match.group(1)
-                    path = bucket_match.group(2)
-                    url = f"https://{bucket}.s3.amazonaws.com/{path}"
-
-            # Download the file
-            with tempfile.NamedTemporaryFile(mode='w+b', delete=False, suffix='.csv') as tmp:
-                tmp_path = tmp.name
-                urllib.request.urlretrieve(url, tmp_path)
-                return tmp_path
+            return _cached_download(url, suffix)
         except Exception:
             return None
 
+    def _sniff(self, path: str) -> Optional[Tuple[str, str, str, str]]:
+        """
+        Detect the delimiter, coordinate columns and encoding of a CSV file.
+
+        Only the first few KB are read; the delimiter comes from
+        ``csv.Sniffer`` and the encoding from the BOM or a UTF-8 decode test.
+
+        :param path: Local path to the CSV file
+        :returns: Tuple of (delimiter, x_field, y_field, encoding), or None
+            if no coordinate columns were found
+        """
+        try:
+            with open(path, "rb") as f:
+                sample = f.read(_SNIFF_SIZE)
+        except OSError:
+            return None
+
+        if sample.startswith(codecs.BOM_UTF8):
+            encoding = "UTF-8"
+            text = sample[len(codecs.BOM_UTF8) :].decode("utf-8", errors="ignore")
+        elif sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            encoding = "UTF-16"
+            text = sample.decode("utf-16", errors="ignore")
+        else:
+            try:
+                # Incremental decoder tolerates a character cut at the end
+                text = codecs.getincrementaldecoder("utf-8")().decode(sample)
+                encoding = "UTF-8"
+            except UnicodeDecodeError:
+                text = sample.decode("latin-1")
+                encoding = "ISO-8859-1"
+
+        try:
+            delimiter = csv.Sniffer().sniff(text, delimiters=",;\t|").delimiter
+        except csv.Error:
+            delimiter = ","
+
+        header = next(csv.reader(io.StringIO(text), delimiter=delimiter), [])
+        x_names = _X_FIELDS | {self.x_field.lower()}
+        y_names = _Y_FIELDS | {self.y_field.lower()}
+        x_field = next((h for h in header if h.lower() in x_names), None)
+        y_field = next((h for h in header if h.lower() in y_names), None)
+
+        if x_field and y_field:
+            return delimiter, x_field, y_field, encoding
+        return None
+
+    def _delimitedtext_uri(
+        self,
+        path: str,
+        x_field: str,
+        y_field: str,
+        delimiter: str = ",",
+        encoding: Optional[str] = None,
+    ) -> str:
+        """
+        Build a delimitedtext provider URI for a local CSV file.
+
+        :param path: Local path to the CSV file
+        :param x_field: Name of the X/longitude column
+        :param y_field: Name of the Y/latitude column
+        :param delimiter: Field delimiter
+        :param encoding: File encoding, or None to let QGIS decide
+        :returns: Provider URI
+        """
+        # Build proper URI with quoted path for delimitedtext; tabs are
+        # passed in the escaped form QGIS expects
+        quoted_path = path.replace("\\", "/")
+        delimiter = delimiter.replace("\t", "\\t")
+        uri = (
+            f'file:///{quoted_path}?type=csv'
+            f'&xField={x_field}'
+            f'&yField={y_field}'
+            f'&crs={self.crs}'
+            f'&delimiter={quote(delimiter, safe=",;|")}'
+            f'&spatialIndex=yes'
+        )
+        if encoding:
+            uri += f"&encoding={encoding}"
+        return uri
+
     def load(self) -> Optional[QgsVectorLayer]:
         """
-        Load the CSV as a point vector layer using OGR.
+        Load the CSV as a point vector layer.
 
         :returns: QgsVectorLayer or None if loading fails
         """
-        # For remote files, download first
-        file_path = self.original_url
-        is_temp = False
-        
-        if self.original_url.startswith(("s3://", "http://", "https://", "gs://", "az://", "abfs://")):
-            downloaded_path = self._download_file(self.original_url)
-            if downloaded_path:
-                file_path = downloaded_path
-                is_temp = True
-            else:
-                return None
+        file_path = self.prepare()
+        return self.create_layer(file_path) if file_path else None
 
-        try:
-            # Use OGR CSV driver which is more robust
-            # OGR handles CSV better than delimitedtext for detecting headers and fields
-            uri = file_path
-            
-            # Try loading with OGR CSV driver
-            layer = QgsVectorLayer(uri, self.layer_name, "ogr")
-            
+    def prepare(self) -> Optional[str]:
+        """
+        Get a local copy of the CSV, downloading remote files.
+
+        Creates no Qt objects, so it can run on a worker thread.
+
+        :returns: Local file path, or None if the download fails
+        """
+        # For remote files, download first (reusing a cached copy if present)
+        if self.original_url.startswith(_SCHEMES):
+            return self._download_file(self.original_url)
+        return self.original_url
+
+    def create_layer(self, file_path: str) -> Optional[QgsVectorLayer]:
+        """
+        Create the point layer for a local file returned by prepare().
+
+        A sniffed delimitedtext layer is tried first, then the OGR CSV
+        driver, then a probe of common coordinate column names. Must run on
+        the main thread.
+
+        :param file_path: Local path to the CSV file
+        :returns: QgsVectorLayer or None if loading fails
+        """
+        _evict_downloads(file_path)
+
+        # Sniff the first few KB so a single layer can be built directly
+        sniffed = self._sniff(file_path)
+        if sniffed:
+            delimiter, x_field, y_field, encoding = sniffed
+            uri = self._delimitedtext_uri(
+                file_path, x_field, y_field, delimiter, encoding
+            )
+            layer = QgsVectorLayer(uri, self.layer_name, "delimitedtext")
             if layer.isValid() and layer.featureCount() > 0:
                 return layer
-            
-            # Fallback: Try with delimitedtext for specific coordinate fields
+
+        # Use OGR CSV driver which is more robust
+        # OGR handles CSV better than delimitedtext for detecting headers and fields
+        ogr_layer = QgsVectorLayer(file_path, self.layer_name, "ogr")
+
+        if ogr_layer.isValid() and ogr_layer.featureCount() > 0:
+            return ogr_layer
+
+        # Fallback: Try with delimitedtext for common coordinate field
+        # names when the header gave no match
+        if not sniffed:
             x_fields = [self.x_field, "lon", "lng", "x", "long", "longitude"]
             y_fields = [self.y_field, "lat", "y", "latitude"]
 
             for x_f in x_fields:
                 for y_f in y_fields:
-                    # Build proper URI with quoted path for delimitedtext
-                    quoted_path = file_path.replace("\\", "/")
-                    uri = (
-                        f'file:///{quoted_path}?type=csv'
-                        f'&xField={x_f}'
-                        f'&yField={y_f}'
-                        f'&crs={self.crs}'
-                        f'&delimiter=,'
-                    )
+                    uri = self._delimitedtext_uri(file_path, x_f, y_f)
 
                     try:
                         layer = QgsVectorLayer(uri, self.layer_name, "delimitedtext")
@@ -207,23 +794,11 @@ class CSVLoader:
                     except Exception:
                         continue
 
-            # If nothing worked, return a basic non-spatial CSV layer
-            try:
-                layer = QgsVectorLayer(file_path, self.layer_name, "ogr")
-                if layer.isValid():
-                    return layer
-            except Exception:
-                pass
+        # If nothing worked, return a basic non-spatial CSV layer
+        if ogr_layer.isValid():
+            return ogr_layer
 
-            return None
-            
-        finally:
-            # Clean up temporary file
-            if is_temp and file_path and os.path.exists(file_path):
-                try:
-                    os.unlink(file_path)
-                except Exception:
-                    pass
+        return None
 
 
 class GeoPackageLoader:
@@ -233,6 +808,8 @@ class GeoPackageLoader:
     Supports loading from local paths and HTTP URLs.
     """
 
+    __slots__ = ("url", "layer_name", "table_name")
+
     def __init__(
         self, url: str, layer_name: str = "GeoPackage", table_name: Optional[str] = None
     ) -> None:
@@ -265,6 +842,7 @@ class GeoPackageLoader:
 
         return None
 
+
 class NetCDFLoader:
     """
     Loads NetCDF (Network Common Data Form) files.
@@ -275,6 +853,8 @@ class NetCDFLoader:
     - S3 URLs (if supported by GDAL)
     """
 
+    __slots__ = ("original_url", "layer_name", "local_file")
+
     def __init__(self, url: str, layer_name: str = "NetCDF") -> None:
         """
         Initialize the NetCDF loader.
@@ -283,9 +863,14 @@ class NetCDFLoader:
         :param layer_name: Name for the loaded layer
         """
         self.original_url = url
-        self.local_file = self._ensure_local_file(url)
         self.layer_name = layer_name
 
+        if url.startswith(("http://", "https://")):
+            # Read remote files in place instead of downloading them
+            self.local_file = f"/vsicurl/{url}"
+        else:
+            self.local_file = url
+
     def _ensure_local_file(self, url: str) -> str:
         """
         Ensure we have a local file path. Download if needed.
@@ -296,18 +881,25 @@ class NetCDFLoader:
         if url.startswith("http://") or url.startswith("https://"):
             # Download to temporary file
             try:
-                temp_file = os.path.join(
-                    tempfile.gettempdir(),
-                    os.path.basename(url).split("?")[0]  # Remove query params
-                )
-                urllib.request.urlretrieve(url, temp_file)
-                return temp_file
+                return _cached_download(url, ".nc")
             except Exception as e:
                 raise RuntimeError(f"Failed to download NetCDF file: {e}")
         else:
             # Local file
             return url
 
+    @staticmethod
+    def _candidates(path: str) -> List[str]:
+        """
+        List the GDAL paths to try for a NetCDF file.
+
+        :param path: Local or GDAL virtual filesystem path
+        :returns: The file itself, then its first subdataset
+        """
+        # NetCDF files may have subdatasets; try with NETCDF: prefix
+        # Example: NETCDF:"file.nc":variable_name
+        return [path, f'NETCDF:"{path}":0']
+
     def load(self) -> Optional[QgsRasterLayer]:
         """
         Load the NetCDF as a raster layer.
@@ -317,23 +909,46 @@ class NetCDFLoader:
 
         :returns: QgsRasterLayer or None if loading fails
         """
-        if not os.path.exists(self.local_file):
+        path = self.prepare()
+        return self.create_layer(path) if path else None
+
+    def prepare(self) -> Optional[str]:
+        """
+        Find a GDAL path that opens the NetCDF file.
+
+        Remote files are first probed through /vsicurl/ so GDAL only reads
+        the byte ranges it needs; the whole file is downloaded only if that
+        fails. Creates no Qt objects, so it can run on a worker thread.
+
+        :returns: GDAL path to open, or None if loading fails
+        """
+        if self.local_file.startswith("/vsicurl/"):
+            _configure_vsicurl()
+            with _remote_open_options():
+                path = _first_openable(self._candidates(self.local_file))
+            if path:
+                return path
+
+            # Fall back to a full download
+            self.local_file = self._ensure_local_file(self.original_url)
+
+        # Reject missing or non-NetCDF files before GDAL tries to open them
+        if not _is_netcdf_file(self.local_file):
             return None
 
-        # Try to load as raster (GDAL handles NetCDF files)
-        layer = QgsRasterLayer(self.local_file, self.layer_name)
+        return _first_openable(self._candidates(self.local_file))
 
-        if layer.isValid():
-            return layer
+    def create_layer(self, path: str) -> Optional[QgsRasterLayer]:
+        """
+        Create the raster layer for a path returned by prepare().
 
-        # NetCDF files may have subdatasets; try with NETCDF: prefix
-        # Example: NETCDF:"file.nc":variable_name
-        try:
-            # List available subdatasets and try the first one
-            layer = QgsRasterLayer(f'NETCDF:"{self.local_file}":0', self.layer_name)
-            if layer.isValid():
-                return layer
-        except Exception:
-            pass
+        Must run on the main thread.
+
+        :param path: GDAL path to open
+        :returns: QgsRasterLayer or None if the layer is invalid
+        """
+        _evict_downloads(path)
 
-        return None
\ No newline at end of file
+        with _remote_open_options("/vsi" in path):
+            layer = QgsRasterLayer(path, self.layer_name)
+        return layer if layer.isValid() else None
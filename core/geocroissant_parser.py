@@ -7,41 +7,225 @@ and extracts relevant information for visualization and data loading in QGIS.
 """
 
 import json
-from typing import Any, Dict, List, Optional, Tuple
+import os
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from .metadata_detector import MetadataDetector, MetadataFormat
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Item fields extracted from recordSet data
+_ITEM_KEYS = ("id", "datetime", "bbox", "assets")
+
+# Item ID and extension of a distribution file, taken from its basename
+_FILE_NAME_RE = re.compile(
+    r"(?P<id>[^/]+?)\.(?P<ext>tif|tiff|cog|csv|nc|gpkg)$", re.IGNORECASE
+)
+
+# encodingFormat markers used to type files whose URL has no extension
+_ENCODING_FILE_TYPES = (
+    ("geotiff", "tif"),
+    ("image/tiff", "tif"),
+    ("text/csv", "csv"),
+    ("netcdf", "nc"),
+    ("geopackage", "gpkg"),
+)
+
+# File types the distribution index is keyed by
+_INDEXED_FILE_TYPES = frozenset(("tif", "csv", "nc", "gpkg"))
+
+# Top-level keys needed to summarize a dataset without loading its records
+_HEADER_KEYS = (
+    "name",
+    "version",
+    "license",
+    "geocr:BoundingBox",
+    "geocr:temporalExtent",
+)
+
+
+@lru_cache(maxsize=8)
+def _parse_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Read and parse a metadata JSON file.
+
+    Results are cached per (path, mtime) so reopening an unchanged file
+    skips the disk read and JSON parsing entirely.
+
+    :param path: Absolute path to the JSON file
+    :param mtime_ns: File modification time, used to invalidate stale entries
+    :returns: Parsed JSON data
+    """
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+
+    if simdjson is not None:
+        # Convert to plain Python objects; simdjson proxies are invalidated
+        # when their parser is reused
+        return simdjson.Parser().load(path).as_dict()
+
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=32)
+def _item_extractor(prefix: str) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Compile an item extractor for record-set fields named ``<prefix><key>``.
+
+    The prefixed field names are baked into the generated function as
+    constants, so no keys are formatted or looped over per record.
+
+    :param prefix: Field name prefix, e.g. "items/" or ""
+    :returns: Function mapping a record to a dict of the present item keys
+    """
+    lines = ["def extract(d):", "    item = {}"]
+    for key in _ITEM_KEYS:
+        full_key = repr(prefix + key)
+        lines.append(f"    if {full_key} in d:")
+        lines.append(f"        item[{key!r}] = d[{full_key}]")
+    lines.append("    return item")
+
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["extract"]
+
+
+def _normalize_file_type(file_type: str) -> str:
+    """
+    Normalize a file type or extension to an index key.
+
+    :param file_type: File type such as "cog", ".tif" or "CSV"
+    :returns: Lowercase type with COG/TIFF variants collapsed to "tif"
+    """
+    file_type = file_type.lower().lstrip(".")
+    if file_type in ("cog", "tif", "tiff"):
+        return "tif"
+    return file_type
+
 
 class GeoCroissantParser:
     """Parser for various geospatial metadata formats."""
 
+    __slots__ = (
+        "file_path",
+        "data",
+        "detector",
+        "_is_gc",
+        "_cache",
+        "name",
+        "version",
+        "license",
+        "description",
+        "keywords",
+        "is_live",
+    )
+
     def __init__(self, file_path: str) -> None:
         """
         Initialize parser with a metadata JSON file.
 
         Automatically detects format (GeoCroissant, CMR-UMM, STAC, etc)
 
+        :param file_path: Path to the metadata JSON file
+        """
+        self._init_state(file_path)
+        self._load()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GeoCroissantParser":
+        """
+        Create a parser from already-parsed metadata, without file I/O.
+
+        :param data: Parsed metadata JSON
+        :returns: GeoCroissantParser over the given data
+        """
+        parser = cls.__new__(cls)
+        parser._init_state("")
+        parser._attach(data)
+        parser._resolve_summary()
+        return parser
+
+    def _init_state(self, file_path: str) -> None:
+        """
+        Set every attribute to its empty default.
+
         :param file_path: Path to the metadata JSON file
         """
         self.file_path = file_path
         self.data: Dict[str, Any] = {}
         self.detector: Optional[MetadataDetector] = None
-        self._load()
+        self._is_gc = False
+        self._cache: Dict[str, Any] = {}
+
+        # Scalar summary fields, resolved once after loading
+        self.name = "Unknown Dataset"
+        self.version = "1.0.0"
+        self.license = "Unknown"
+        self.description = ""
+        self.keywords: List[str] = []
+        self.is_live = False
 
     def _load(self) -> None:
         """Load and parse the JSON file."""
         try:
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                self.data = json.load(f)
-            
-            # Initialize detector for format-agnostic parsing
-            self.detector = MetadataDetector(self.data)
+            path = os.path.abspath(self.file_path)
+            self._attach(_parse_cached(path, os.stat(path).st_mtime_ns))
         except Exception as e:
             print(f"Error loading file {self.file_path}: {e}")
             self.detector = None
 
-    def get_name(self) -> str:
-        """Get dataset name."""
+        self._resolve_summary()
+
+    def _attach(self, data: Dict[str, Any]) -> None:
+        """
+        Take parsed metadata and detect its format.
+
+        :param data: Parsed metadata JSON
+        """
+        self.data = data
+
+        # Initialize detector for format-agnostic parsing
+        self.detector = MetadataDetector(self.data)
+        self._is_gc = self.detector.format == MetadataFormat.GEOCROISSANT
+
+    def _resolve_summary(self) -> None:
+        """Resolve the scalar summary fields from the loaded data."""
+        self.name = self._resolve_name()
+
+        if self._is_gc:
+            self.version = self.data.get("version", "1.0.0")
+            self.license = self.data.get("license", "Unknown")
+        else:
+            self.version = "1.0.0"
+            self.license = "Unknown"
+
+        if self.detector:
+            self.description = self.detector.get_description()
+        else:
+            self.description = self.data.get("description", "")
+
+        self.keywords = self.data.get("keywords", [])
+        self.is_live = self.data.get("isLiveDataset", False)
+
+    def _resolve_name(self) -> str:
+        """Resolve the dataset name from the detector or raw data."""
         try:
             if self.detector:
                 name = self.detector.get_name()
@@ -49,27 +233,78 @@ class GeoCroissantParser:
                     return name
         except Exception as e:
             print(f"Error getting name from detector: {e}")
-        
+
         # Fallback approaches
         return self.data.get("name", "Unknown Dataset")
 
+    @staticmethod
+    def _load_header_only(path: str) -> Dict[str, Any]:
+        """
+        Stream the top-level header keys of a file without parsing records.
+
+        Large ``recordSet``/``distribution`` arrays are skipped by the
+        tokenizer instead of being materialized as Python objects.
+
+        :param path: Path to the metadata JSON file
+        :returns: Dict with the header keys present in the file
+        """
+        header: Dict[str, Any] = {}
+        builder = None
+        current = ""
+
+        with open(path, "rb") as f:
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if builder is not None:
+                    builder.event(event, value)
+                    if prefix == current and event in ("end_map", "end_array"):
+                        header[current] = builder.value
+                        builder = None
+                elif prefix in _HEADER_KEYS:
+                    if event in ("start_map", "start_array"):
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                        current = prefix
+                    elif event != "map_key":
+                        header[prefix] = value
+
+                if builder is None and len(header) == len(_HEADER_KEYS):
+                    break
+
+        return header
+
+    @classmethod
+    def peek(cls, file_path: str) -> Dict[str, Any]:
+        """
+        Read only the summary fields of a dataset.
+
+        Uses ijson streaming when available, otherwise falls back to a
+        full (cached) parse.
+
+        :param file_path: Path to the metadata JSON file
+        :returns: Dict with name, version, license, bbox and temporal extent
+        """
+        if ijson is not None:
+            return cls._load_header_only(file_path)
+
+        path = os.path.abspath(file_path)
+        data = _parse_cached(path, os.stat(path).st_mtime_ns)
+        return {key: data[key] for key in _HEADER_KEYS if key in data}
+
+    def get_name(self) -> str:
+        """Get dataset name."""
+        return self.name
+
     def get_version(self) -> str:
         """Get dataset version."""
-        if self.detector and self.detector.format == MetadataFormat.GEOCROISSANT:
-            return self.data.get("version", "1.0.0")
-        return "1.0.0"
+        return self.version
 
     def get_license(self) -> str:
         """Get dataset license."""
-        if self.detector and self.detector.format == MetadataFormat.GEOCROISSANT:
-            return self.data.get("license", "Unknown")
-        return "Unknown"
+        return self.license
 
     def get_description(self) -> str:
         """Get dataset description."""
-        if self.detector:
-            return self.detector.get_description()
-        return self.data.get("description", "")
+        return self.description
 
     def get_bounding_box(self) -> Optional[List[float]]:
         """
@@ -77,15 +312,16 @@ class GeoCroissantParser:
 
         :returns: List [west, south, east, north] or None
         """
+        if self._is_gc:
+            bbox = self.data.get("geocr:BoundingBox")
+            if bbox and len(bbox) >= 4:
+                return bbox[:4]
+            return None
+
         if self.detector:
             extent = self.detector.get_spatial_extent()
             if extent:
                 return [extent["west"], extent["south"], extent["east"], extent["north"]]
-        
-        # Fallback to old format
-        bbox = self.data.get("geocr:BoundingBox")
-        if bbox and len(bbox) >= 4:
-            return bbox[:4]
         return None
 
     def get_temporal_extent(self) -> Optional[Dict[str, str]]:
@@ -94,6 +330,9 @@ class GeoCroissantParser:
 
         :returns: Dict with startDate and endDate, or None
         """
+        if self._is_gc:
+            return self.data.get("geocr:temporalExtent")
+
         if self.detector:
             temporal = self.detector.get_temporal_extent()
             if temporal:
@@ -102,25 +341,40 @@ class GeoCroissantParser:
                     "startDate": temporal.get("start", ""),
                     "endDate": temporal.get("end", ""),
                 }
-        
-        return self.data.get("geocr:temporalExtent")
+        return None
 
     def get_spatial_resolution(self) -> str:
         """Get spatial resolution."""
+        if self._is_gc:
+            return self.data.get("geocr:spatialResolution", "Unknown")
+
         if self.detector:
             resolution = self.detector.get_spatial_resolution()
             if resolution:
                 return resolution
-        return self.data.get("geocr:spatialResolution", "Unknown")
+        return "Unknown"
 
     def get_crs(self) -> str:
         """Get coordinate reference system."""
+        if self._is_gc:
+            return self.data.get("geocr:coordinateReferenceSystem", "EPSG:4326")
+
         if self.detector:
-            crs = self.detector.get_crs()
-            if crs and crs != "EPSG:4326":
-                return crs
-        
-        return self.data.get("geocr:coordinateReferenceSystem", "EPSG:4326")
+            return self.detector.get_crs() or "EPSG:4326"
+        return "EPSG:4326"
+
+    def _partition_distribution(self) -> None:
+        """Split the distribution into file objects and file sets in one pass."""
+        files: List[Dict[str, Any]] = []
+        file_sets: List[Dict[str, Any]] = []
+        for d in self.data.get("distribution", []):
+            obj_type = d.get("@type")
+            if obj_type == "cr:FileObject":
+                files.append(d)
+            elif obj_type == "cr:FileSet":
+                file_sets.append(d)
+        self._cache["distribution_files"] = files
+        self._cache["file_sets"] = file_sets
 
     def get_distribution_files(self) -> List[Dict[str, Any]]:
         """
@@ -128,8 +382,9 @@ class GeoCroissantParser:
 
         :returns: List of file objects with contentUrl, encodingFormat, etc.
         """
-        distribution = self.data.get("distribution", [])
-        return [d for d in distribution if d.get("@type") == "cr:FileObject"]
+        if "distribution_files" not in self._cache:
+            self._partition_distribution()
+        return self._cache["distribution_files"]
 
     def get_file_sets(self) -> List[Dict[str, Any]]:
         """
@@ -137,8 +392,9 @@ class GeoCroissantParser:
 
         :returns: List of file set objects
         """
-        distribution = self.data.get("distribution", [])
-        return [d for d in distribution if d.get("@type") == "cr:FileSet"]
+        if "file_sets" not in self._cache:
+            self._partition_distribution()
+        return self._cache["file_sets"]
 
     def get_record_sets(self) -> List[Dict[str, Any]]:
         """
@@ -157,10 +413,11 @@ class GeoCroissantParser:
 
         :returns: List of item dictionaries
         """
-        items = []
-        record_sets = self.get_record_sets()
+        if "items" in self._cache:
+            return self._cache["items"]
 
-        for record_set in record_sets:
+        items: List[Dict[str, Any]] = []
+        for record_set in self.get_record_sets():
             data = record_set.get("data", [])
             fields = record_set.get("field", [])
 
@@ -168,29 +425,53 @@ class GeoCroissantParser:
             prefix = ""
             if fields:
                 first_field_id = fields[0].get("@id", "")
-                if "/" in first_field_id:
-                    prefix = first_field_id.rsplit("/", 1)[0] + "/"
+                prefix = first_field_id[: first_field_id.rfind("/") + 1]
 
-            for item_data in data:
-                item = {}
+            # Pick the extraction loop once per record set instead of per item
+            extract = _item_extractor(prefix)
+            if data and extract(data[0]):
+                items.extend(self._items_with_prefix(data, extract))
+            else:
+                items.extend(self._items_raw(data))
 
-                # Extract values using the prefix
-                for key in ["id", "datetime", "bbox", "assets"]:
-                    full_key = f"{prefix}{key}"
-                    if full_key in item_data:
-                        item[key] = item_data[full_key]
+        self._cache["items"] = items
+        return items
 
-                # Fallback to direct keys
-                if not item:
-                    for k, v in item_data.items():
-                        # Strip prefix from key
-                        simple_key = k.split("/")[-1] if "/" in k else k
-                        item[simple_key] = v
+    @staticmethod
+    def _items_with_prefix(
+        data: List[Dict[str, Any]],
+        extract: Callable[[Dict[str, Any]], Dict[str, Any]],
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Extract the known item keys from records using prefixed field names.
 
-                if item:
-                    items.append(item)
+        :param data: Record set rows
+        :param extract: Extractor from _item_extractor() for the prefix
+        :returns: Iterator of item dictionaries
+        """
+        for item_data in data:
+            item = extract(item_data)
+            if item:
+                yield item
 
-        return items
+    @staticmethod
+    def _items_raw(data: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Copy records as items, stripping any field prefix from each key.
+
+        :param data: Record set rows
+        :returns: Iterator of item dictionaries
+        """
+        simple_keys: Dict[str, str] = {}
+        for item_data in data:
+            item = {}
+            for k, v in item_data.items():
+                simple_key = simple_keys.get(k)
+                if simple_key is None:
+                    simple_key = simple_keys[k] = k[k.rfind("/") + 1 :]
+                item[simple_key] = v
+            if item:
+                yield item
 
     def get_item_count(self) -> int:
         """Get the number of items."""
@@ -202,11 +483,13 @@ class GeoCroissantParser:
 
         :returns: "tiles" if recordSet contains data items, "files" otherwise
         """
-        record_sets = self.get_record_sets()
-        for record_set in record_sets:
-            if record_set.get("data"):
-                return "tiles"
-        return "files"
+        if "dataset_type" not in self._cache:
+            self._cache["dataset_type"] = (
+                "tiles"
+                if any(record_set.get("data") for record_set in self.get_record_sets())
+                else "files"
+            )
+        return self._cache["dataset_type"]
 
     def get_references(self) -> List[Dict[str, Any]]:
         """
@@ -216,6 +499,83 @@ class GeoCroissantParser:
         """
         return self.data.get("references", [])
 
+    def _get_file_index(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        Build a lookup of distribution files by (item_id, file type).
+
+        Item IDs are taken from the ``contentUrl`` basename and from the
+        ``<item_id>/<role>`` form of ``@id``. The file type comes from the
+        URL extension, or from ``encodingFormat`` when the URL has none;
+        roles such as ``cog`` or ``training_data_csv`` also key the file
+        by the type their last word names. The first file wins, matching
+        the order of a linear scan.
+
+        :returns: Dict mapping (item_id, normalized type) to file objects
+        """
+        if "file_index" in self._cache:
+            return self._cache["file_index"]
+
+        index: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        files_by_item: Dict[str, List[Dict[str, Any]]] = {}
+
+        for file_obj in self.get_distribution_files():
+            item_ids = []
+            file_type = None
+
+            match = _FILE_NAME_RE.search(file_obj.get("contentUrl", ""))
+            if match:
+                item_ids.append(match.group("id"))
+                file_type = _normalize_file_type(match.group("ext"))
+            else:
+                encoding_format = file_obj.get("encodingFormat", "").lower()
+                file_type = next(
+                    (
+                        alias
+                        for marker, alias in _ENCODING_FILE_TYPES
+                        if marker in encoding_format
+                    ),
+                    None,
+                )
+
+            file_types = [file_type] if file_type else []
+
+            file_id = file_obj.get("@id", "")
+            slash = file_id.find("/")
+            if slash != -1:
+                item_ids.append(file_id[:slash])
+                role = file_id[slash + 1 :]
+                role_type = _normalize_file_type(role[role.rfind("_") + 1 :])
+                if role_type in _INDEXED_FILE_TYPES and role_type != file_type:
+                    file_types.append(role_type)
+
+            for item_id in dict.fromkeys(item_ids):
+                files_by_item.setdefault(item_id, []).append(file_obj)
+                for indexed_type in file_types:
+                    index.setdefault((item_id, indexed_type), file_obj)
+
+        self._cache["file_index"] = index
+        self._cache["files_by_item"] = files_by_item
+        return index
+
+    def build_index(self) -> None:
+        """
+        Build the distribution file index ahead of the first lookup.
+
+        Lets callers that parse on a worker thread pay the indexing cost
+        there instead of on the first find_distribution_file() call.
+        """
+        self._get_file_index()
+
+    def get_item_files(self, item_id: str) -> List[Dict[str, Any]]:
+        """
+        Get all distribution files that belong to an item.
+
+        :param item_id: The item/tile ID
+        :returns: List of file objects, in distribution order
+        """
+        self._get_file_index()
+        return self._cache["files_by_item"].get(item_id, [])
+
     def find_distribution_file(
         self, item_id: str, file_type: str
     ) -> Optional[Dict[str, Any]]:
@@ -226,39 +586,74 @@ class GeoCroissantParser:
         :param file_type: The file type to match (e.g., "cog", "csv", ".tif")
         :returns: Matching file object or None
         """
-        files = self.get_distribution_files()
-
-        for file_obj in files:
-            file_id = file_obj.get("@id", "")
-            file_name = file_obj.get("name", "")
-            content_url = file_obj.get("contentUrl", "")
-            encoding_format = file_obj.get("encodingFormat", "")
-
-            # Check if item_id is in the file identifier
-            if item_id in file_id or item_id in file_name or item_id in content_url:
-                # Check file type match - try multiple variations
-                file_type_lower = file_type.lower()
-                
-                # Direct checks
-                if file_type_lower in file_id.lower():
-                    return file_obj
-                if file_type_lower in file_name.lower():
-                    return file_obj
-                if file_type_lower in content_url.lower():
-                    return file_obj
-                
-                # Check encoding format for CSV
-                if file_type_lower == "csv" and "text/csv" in encoding_format.lower():
-                    return file_obj
-                if file_type_lower == "csv" and ".csv" in content_url.lower():
-                    return file_obj
-                
-                # Check for COG/TIF variations
-                if file_type_lower in ["cog", ".tif", "tif"] and ("cog" in file_id.lower() or ".tif" in content_url.lower() or "geotiff" in encoding_format.lower()):
-                    return file_obj
+        key = (item_id, _normalize_file_type(file_type))
+        file_obj = self._get_file_index().get(key)
+        if file_obj is not None:
+            return file_obj
+
+        # Fall back to a full scan for files the index could not classify
+        file_type_lower = file_type.lower()
+        is_csv = file_type_lower == "csv"
+        is_cog = file_type_lower in ("cog", ".tif", "tif")
+
+        for (
+            file_obj,
+            haystack,
+            haystack_lower,
+            id_lower,
+            url_lower,
+            encoding,
+        ) in self._get_file_search():
+            # Check if item_id is in the file identifier, name or URL
+            if item_id not in haystack:
+                continue
+
+            # Direct checks
+            if file_type_lower in haystack_lower:
+                return file_obj
+
+            # Check encoding format for CSV
+            if is_csv and ("text/csv" in encoding or ".csv" in url_lower):
+                return file_obj
+
+            # Check for COG/TIF variations
+            if is_cog and (
+                "cog" in id_lower or ".tif" in url_lower or "geotiff" in encoding
+            ):
+                return file_obj
 
         return None
 
+    def _get_file_search(self) -> List[Tuple[Dict[str, Any], str, str, str, str, str]]:
+        """
+        Precompute the strings searched by find_distribution_file().
+
+        The ``@id``, name and URL of each file are joined with NUL
+        separators so one substring test covers all three, and lowered
+        once instead of on every lookup.
+
+        :returns: List of (file, joined, joined lower, id lower,
+            URL lower, encoding format lower) tuples
+        """
+        if "file_search" not in self._cache:
+            search = []
+            for file_obj in self.get_distribution_files():
+                file_id = file_obj.get("@id", "")
+                content_url = file_obj.get("contentUrl", "")
+                haystack = f"{file_id}\0{file_obj.get('name', '')}\0{content_url}"
+                search.append(
+                    (
+                        file_obj,
+                        haystack,
+                        haystack.lower(),
+                        file_id.lower(),
+                        content_url.lower(),
+                        file_obj.get("encodingFormat", "").lower(),
+                    )
+                )
+            self._cache["file_search"] = search
+        return self._cache["file_search"]
+
     def get_visualizations(self) -> Dict[str, Any]:
         """
         Get visualization configurations.
@@ -277,11 +672,11 @@ class GeoCroissantParser:
 
     def is_live_dataset(self) -> bool:
         """Check if this is a live (updating) dataset."""
-        return self.data.get("isLiveDataset", False)
+        return self.is_live
 
     def get_keywords(self) -> List[str]:
         """Get dataset keywords."""
-        return self.data.get("keywords", [])
+        return self.keywords
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the raw data dictionary."""
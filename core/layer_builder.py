@@ -6,26 +6,109 @@ Creates QGIS vector layers from GeoCroissant metadata,
 including tile index layers and bounding box layers.
 """
 
-from typing import Any, Dict, List, Optional
+import json
+import struct
+from typing import Any, Dict, Iterator, List, Optional
 
 from qgis.core import (
     QgsVectorLayer,
     QgsFeature,
+    QgsFeatureSink,
     QgsGeometry,
-    QgsPointXY,
+    QgsRectangle,
     QgsField,
-    QgsFields,
     QgsSymbol,
     QgsSimpleFillSymbolLayer,
     QgsSingleSymbolRenderer,
+    Qgis,
 )
-from qgis.PyQt.QtCore import QVariant
 from qgis.PyQt.QtGui import QColor
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# QgsField takes QMetaType from QGIS 3.38; older releases need QVariant
+if Qgis.QGIS_VERSION_INT >= 33800:
+    from qgis.PyQt.QtCore import QMetaType
+
+    _STRING = QMetaType.Type.QString
+    _DOUBLE = QMetaType.Type.Double
+else:
+    from qgis.PyQt.QtCore import QVariant
+
+    _STRING = QVariant.String
+    _DOUBLE = QVariant.Double
+
+# Serializer for the assets attribute, chosen once at import
+if orjson is not None:
+
+    def _assets_json(assets: Any) -> str:
+        return orjson.dumps(assets).decode()
+
+else:
+
+    def _assets_json(assets: Any) -> str:
+        return json.dumps(assets, separators=(",", ":"))
+
+
+# Features handed to the data provider per addFeatures() call
+_FEATURE_BATCH_SIZE = 1000
+
+# Little-endian WKB polygon with one closed 5-point ring (93 bytes)
+_WKB_POLYGON = struct.Struct("<BIII10d")
+
+
+# Ring vertex order as indices into (west, south, east, north)
+_RING_ORDER = (0, 1, 2, 1, 2, 3, 0, 3, 0, 1)
+
+# Byte order, geometry type, ring count and point count preceding the ring
+_WKB_HEADER = struct.pack("<BIII", 1, 3, 1, 5)
+
+
+def _wkb_geometry(wkb: bytes) -> QgsGeometry:
+    """
+    Create a geometry from WKB bytes.
+
+    :param wkb: Well-known binary geometry
+    :returns: QgsGeometry
+    """
+    geometry = QgsGeometry()
+    geometry.fromWkb(wkb)
+    return geometry
+
+
+def _bbox_wkbs(boxes: List[List[float]]) -> List[bytes]:
+    """
+    Pack rectangle polygon WKB for a batch of bounding boxes.
+
+    With NumPy available all rings are laid out in one vectorized pass;
+    otherwise each box is packed with struct.
+
+    :param boxes: (west, south, east, north) per box
+    :returns: WKB bytes per box
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return [
+            _WKB_POLYGON.pack(1, 3, 1, 5, *(box[i] for i in _RING_ORDER))
+            for box in boxes
+        ]
+
+    rings = np.ascontiguousarray(np.asarray(boxes, dtype="<f8")[:, _RING_ORDER])
+    out = np.empty((len(boxes), _WKB_POLYGON.size), dtype=np.uint8)
+    out[:, : len(_WKB_HEADER)] = np.frombuffer(_WKB_HEADER, dtype=np.uint8)
+    out[:, len(_WKB_HEADER) :] = rings.view(np.uint8)
+    return [row.tobytes() for row in out]
+
 
 class TileLayerBuilder:
     """Builds a vector layer showing tile extents from GeoCroissant items."""
 
+    __slots__ = ("items", "crs", "dataset_name")
+
     def __init__(
         self,
         items: List[Dict[str, Any]],
@@ -60,61 +143,88 @@ class TileLayerBuilder:
         provider = layer.dataProvider()
 
         # Add fields
-        fields = QgsFields()
-        fields.append(QgsField("id", QVariant.String))
-        fields.append(QgsField("datetime", QVariant.String))
-        fields.append(QgsField("assets", QVariant.String))
-        fields.append(QgsField("west", QVariant.Double))
-        fields.append(QgsField("south", QVariant.Double))
-        fields.append(QgsField("east", QVariant.Double))
-        fields.append(QgsField("north", QVariant.Double))
-        provider.addAttributes(fields)
+        provider.addAttributes(
+            [
+                QgsField("id", _STRING),
+                QgsField("datetime", _STRING),
+                QgsField("assets", _STRING),
+                QgsField("west", _DOUBLE),
+                QgsField("south", _DOUBLE),
+                QgsField("east", _DOUBLE),
+                QgsField("north", _DOUBLE),
+            ]
+        )
         layer.updateFields()
 
-        # Add features
-        features = []
+        # Add features in batches so the full feature list is never held;
+        # FastInsert skips writing assigned feature IDs back to each feature
+        batch: List[QgsFeature] = []
+        for feature in self._iter_features():
+            batch.append(feature)
+            if len(batch) >= _FEATURE_BATCH_SIZE:
+                provider.addFeatures(batch, QgsFeatureSink.FastInsert)
+                batch = []
+        if batch:
+            provider.addFeatures(batch, QgsFeatureSink.FastInsert)
+
+        layer.updateExtents()
+
+        # Apply styling
+        self._apply_style(layer)
+
+        return layer
+
+    def _iter_features(self) -> Iterator[QgsFeature]:
+        """
+        Build one tile polygon feature per item with a valid bbox.
+
+        :returns: Iterator of QgsFeature
+        """
+        # Geometries are packed a batch at a time so the WKB fill is vectorized
+        pending: List[Dict[str, Any]] = []
+        boxes: List[List[float]] = []
         for item in self.items:
             bbox = item.get("bbox", [])
             if len(bbox) < 4:
                 continue
 
-            west, south, east, north = bbox[0], bbox[1], bbox[2], bbox[3]
-
-            # Create polygon from bbox
-            polygon = QgsGeometry.fromPolygonXY(
-                [
-                    [
-                        QgsPointXY(west, south),
-                        QgsPointXY(east, south),
-                        QgsPointXY(east, north),
-                        QgsPointXY(west, north),
-                        QgsPointXY(west, south),
-                    ]
-                ]
-            )
+            pending.append(item)
+            boxes.append(bbox[:4])
+            if len(boxes) >= _FEATURE_BATCH_SIZE:
+                yield from self._build_features(pending, boxes)
+                pending = []
+                boxes = []
+        if boxes:
+            yield from self._build_features(pending, boxes)
+
+    @staticmethod
+    def _build_features(
+        items: List[Dict[str, Any]], boxes: List[List[float]]
+    ) -> Iterator[QgsFeature]:
+        """
+        Build tile polygon features for a batch of items.
 
+        :param items: Items with a valid bbox
+        :param boxes: First four bbox values of each item
+        :returns: Iterator of QgsFeature
+        """
+        for item, (west, south, east, north), wkb in zip(
+            items, boxes, _bbox_wkbs(boxes)
+        ):
             feature = QgsFeature()
-            feature.setGeometry(polygon)
+            feature.setGeometry(_wkb_geometry(wkb))
             feature.setAttributes(
                 [
                     item.get("id", ""),
                     item.get("datetime", ""),
-                    str(item.get("assets", [])),
+                    _assets_json(item.get("assets") or []),
                     west,
                     south,
                     east,
                     north,
                 ]
             )
-            features.append(feature)
-
-        provider.addFeatures(features)
-        layer.updateExtents()
-
-        # Apply styling
-        self._apply_style(layer)
-
-        return layer
+            yield feature
 
     def _apply_style(self, layer: QgsVectorLayer) -> None:
         """Apply default styling to the tile layer."""
@@ -134,6 +244,8 @@ class TileLayerBuilder:
 class BboxLayerBuilder:
     """Builds a vector layer showing the overall dataset bounding box."""
 
+    __slots__ = ("bbox", "crs", "dataset_name")
+
     def __init__(
         self,
         bbox: List[float],
@@ -171,13 +283,15 @@ class BboxLayerBuilder:
         provider = layer.dataProvider()
 
         # Add fields
-        fields = QgsFields()
-        fields.append(QgsField("name", QVariant.String))
-        fields.append(QgsField("west", QVariant.Double))
-        fields.append(QgsField("south", QVariant.Double))
-        fields.append(QgsField("east", QVariant.Double))
-        fields.append(QgsField("north", QVariant.Double))
-        provider.addAttributes(fields)
+        provider.addAttributes(
+            [
+                QgsField("name", _STRING),
+                QgsField("west", _DOUBLE),
+                QgsField("south", _DOUBLE),
+                QgsField("east", _DOUBLE),
+                QgsField("north", _DOUBLE),
+            ]
+        )
         layer.updateFields()
 
         west, south, east, north = (
@@ -187,18 +301,8 @@ class BboxLayerBuilder:
             self.bbox[3],
         )
 
-        # Create polygon from bbox
-        polygon = QgsGeometry.fromPolygonXY(
-            [
-                [
-                    QgsPointXY(west, south),
-                    QgsPointXY(east, south),
-                    QgsPointXY(east, north),
-                    QgsPointXY(west, north),
-                    QgsPointXY(west, south),
-                ]
-            ]
-        )
+        # Create polygon from bbox; the ring is built in C++
+        polygon = QgsGeometry.fromRect(QgsRectangle(west, south, east, north))
 
         feature = QgsFeature()
         feature.setGeometry(polygon)
@@ -212,7 +316,7 @@ class BboxLayerBuilder:
             ]
         )
 
-        provider.addFeatures([feature])
+        provider.addFeatures([feature], QgsFeatureSink.FastInsert)
         layer.updateExtents()
 
         # Apply styling
@@ -21,17 +21,371 @@ class MetadataFormat(Enum):
     GENERIC = "generic"
 
 
+# Boundaries with fewer points are cheaper to reduce in plain Python
+_NUMPY_MIN_POINTS = 64
+
+
+def _points_bounds(points: List[Dict[str, Any]]) -> Tuple[float, float, float, float]:
+    """
+    Compute the (west, south, east, north) bounds of CMR boundary points.
+
+    :param points: Non-empty list of dicts with Longitude/Latitude
+    :returns: Bounds tuple
+    """
+    if len(points) >= _NUMPY_MIN_POINTS:
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        if np is not None:
+            coords = np.fromiter(
+                ((p.get("Longitude", 0.0), p.get("Latitude", 0.0)) for p in points),
+                dtype=np.dtype((np.float64, 2)),
+                count=len(points),
+            )
+            west, south = coords.min(axis=0)
+            east, north = coords.max(axis=0)
+            return float(west), float(south), float(east), float(north)
+
+    west = east = points[0].get("Longitude", 0)
+    south = north = points[0].get("Latitude", 0)
+    for p in points:
+        lon = p.get("Longitude", 0)
+        lat = p.get("Latitude", 0)
+        if lon < west:
+            west = lon
+        elif lon > east:
+            east = lon
+        if lat < south:
+            south = lat
+        elif lat > north:
+            north = lat
+    return west, south, east, north
+
+
+class _FormatImpl:
+    """Accessors shared by all formats; subclasses override per format."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        """
+        :param data: Parsed JSON data
+        """
+        self.data = data
+
+    def get_name(self) -> str:
+        return self.data.get(
+            "name", self.data.get("title", self.data.get("id", "Unknown Dataset"))
+        )
+
+    def get_description(self) -> str:
+        return self.data.get("description") or self.data.get("abstract") or ""
+
+    def get_spatial_extent(self) -> Optional[Dict[str, Any]]:
+        return None
+
+    def get_temporal_extent(self) -> Optional[Dict[str, str]]:
+        return None
+
+    def get_crs(self) -> str:
+        return "EPSG:4326"
+
+    def get_spatial_resolution(self) -> Optional[str]:
+        return None
+
+    def get_download_urls(self) -> List[Dict[str, str]]:
+        return []
+
+    def get_metadata_items(self) -> List[Tuple[str, str]]:
+        return []
+
+    def get_assets(self) -> List[Dict[str, Any]]:
+        return []
+
+
+class _CmrUmmImpl(_FormatImpl):
+    """NASA CMR-UMM accessors."""
+
+    __slots__ = ("_umm", "_meta", "_attributes")
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        super().__init__(data)
+        self._umm = data.get("umm", {})
+        self._meta = data.get("meta", {})
+        self._attributes = self._umm.get("AdditionalAttributes", [])
+
+    def _entry_title(self) -> str:
+        collection_ref = self._umm.get("CollectionReference", {})
+        return collection_ref.get("EntryTitle", "")
+
+    def _attribute_values(self, name: str) -> List[Any]:
+        for attr in self._attributes:
+            if attr.get("Name") == name:
+                return attr.get("Values", [])
+        return []
+
+    def get_name(self) -> str:
+        collection_ref = self._umm.get("CollectionReference", {})
+        return collection_ref.get(
+            "EntryTitle", self._umm.get("GranuleUR", "Unknown Dataset")
+        )
+
+    def get_description(self) -> str:
+        entry_title = self._entry_title()
+        return entry_title if entry_title else ""
+
+    def get_spatial_extent(self) -> Optional[Dict[str, Any]]:
+        spatial = self._umm.get("SpatialExtent", {})
+        horizontal = spatial.get("HorizontalSpatialDomain", {})
+        geometry = horizontal.get("Geometry", {})
+        polygons = geometry.get("GPolygons", [])
+
+        if polygons:
+            boundary = polygons[0].get("Boundary", {})
+            points = boundary.get("Points", [])
+            if points:
+                west, south, east, north = _points_bounds(points)
+                return {
+                    "west": west,
+                    "south": south,
+                    "east": east,
+                    "north": north,
+                }
+        return None
+
+    def get_temporal_extent(self) -> Optional[Dict[str, str]]:
+        temporal = self._umm.get("TemporalExtent", {})
+        range_dt = temporal.get("RangeDateTime", {})
+
+        start = range_dt.get("BeginningDateTime")
+        end = range_dt.get("EndingDateTime")
+
+        if start or end:
+            return {
+                "start": start or "",
+                "end": end or "",
+            }
+        return None
+
+    def get_crs(self) -> str:
+        values = self._attribute_values("HORIZONTAL_CS_CODE")
+        if values:
+            return values[0]
+        return "EPSG:4326"
+
+    def get_spatial_resolution(self) -> Optional[str]:
+        values = self._attribute_values("SPATIAL_RESOLUTION")
+        if values:
+            return f"{values[0]} m"
+        return None
+
+    def get_download_urls(self) -> List[Dict[str, str]]:
+        urls = []
+        for url_obj in self._umm.get("RelatedUrls", []):
+            url_type = url_obj.get("Type", "")
+            if "GET DATA" in url_type or "DOWNLOAD" in url_type:
+                urls.append(
+                    {
+                        "url": url_obj.get("URL", ""),
+                        "name": url_obj.get("Description", ""),
+                        "type": url_type,
+                    }
+                )
+        return urls
+
+    def get_metadata_items(self) -> List[Tuple[str, str]]:
+        items = []
+
+        # Basic info
+        items.append(("Provider", self._meta.get("provider-id", "-")))
+        items.append(("Concept ID", self._meta.get("concept-id", "-")))
+        items.append(("Format", self._meta.get("format", "-")))
+
+        # Temporal
+        temporal = self.get_temporal_extent()
+        if temporal:
+            items.append(("Start Date", temporal.get("start", "-")))
+            items.append(("End Date", temporal.get("end", "-")))
+
+        # Spatial attributes
+        attr_dict = {
+            attr.get("Name"): attr.get("Values", []) for attr in self._attributes
+        }
+
+        for key in ["CLOUD_COVERAGE", "MGRS_TILE_ID", "SPATIAL_COVERAGE", "ACCODE"]:
+            if key in attr_dict and attr_dict[key]:
+                items.append((key.replace("_", " "), str(attr_dict[key][0])))
+
+        return items
+
+    def get_assets(self) -> List[Dict[str, Any]]:
+        assets = []
+        for i, url in enumerate(self.get_download_urls()):
+            assets.append(
+                {
+                    "id": f"asset_{i}",
+                    "url": url.get("url"),
+                    "title": url.get("name"),
+                    "description": url.get("type"),
+                }
+            )
+        return assets
+
+
+class _StacImpl(_FormatImpl):
+    """STAC accessors."""
+
+    __slots__ = ()
+
+    def get_name(self) -> str:
+        return self.data.get("title", self.data.get("id", "Unknown Dataset"))
+
+    def get_spatial_extent(self) -> Optional[Dict[str, Any]]:
+        bbox = self.data.get("bbox")
+        if bbox and len(bbox) >= 4:
+            return {
+                "west": bbox[0],
+                "south": bbox[1],
+                "east": bbox[2],
+                "north": bbox[3],
+            }
+        return None
+
+    def get_temporal_extent(self) -> Optional[Dict[str, str]]:
+        start = self.data.get("start_datetime")
+        end = self.data.get("end_datetime")
+        if start or end:
+            return {"start": start or "", "end": end or ""}
+        return None
+
+    def get_assets(self) -> List[Dict[str, Any]]:
+        assets = []
+        for asset_id, asset_info in self.data.get("assets", {}).items():
+            assets.append(
+                {
+                    "id": asset_id,
+                    "url": asset_info.get("href", ""),
+                    "title": asset_info.get("title", asset_id),
+                    "description": asset_info.get("description", ""),
+                    "media_type": asset_info.get("type", ""),
+                }
+            )
+        return assets
+
+
+class _GeoCroissantImpl(_FormatImpl):
+    """GeoCroissant accessors."""
+
+    __slots__ = ()
+
+    def get_name(self) -> str:
+        return self.data.get("name", "Unknown Dataset")
+
+    def get_spatial_extent(self) -> Optional[Dict[str, Any]]:
+        bbox = self.data.get("geocr:BoundingBox")
+        if bbox and len(bbox) >= 4:
+            return {
+                "west": bbox[0],
+                "south": bbox[1],
+                "east": bbox[2],
+                "north": bbox[3],
+            }
+        return None
+
+    def get_temporal_extent(self) -> Optional[Dict[str, str]]:
+        temporal = self.data.get("geocr:temporalExtent")
+        if temporal:
+            return temporal
+        return None
+
+    def get_crs(self) -> str:
+        return self.data.get("geocr:coordinateReferenceSystem", "EPSG:4326")
+
+    def get_spatial_resolution(self) -> Optional[str]:
+        return self.data.get("geocr:spatialResolution")
+
+    def get_download_urls(self) -> List[Dict[str, str]]:
+        urls = []
+        for item in self.data.get("distribution", []):
+            if item.get("@type") == "cr:FileObject":
+                urls.append(
+                    {
+                        "url": item.get("contentUrl", ""),
+                        "name": item.get("name", ""),
+                        "type": item.get("encodingFormat", ""),
+                    }
+                )
+        return urls
+
+    def get_metadata_items(self) -> List[Tuple[str, str]]:
+        return [
+            ("Version", self.data.get("version", "-")),
+            ("License", self.data.get("license", "-")),
+            ("Conforms To", self.data.get("conformsTo", "-")),
+        ]
+
+    def get_assets(self) -> List[Dict[str, Any]]:
+        assets = []
+        for item in self.data.get("distribution", []):
+            assets.append(
+                {
+                    "id": item.get("@id", ""),
+                    "url": item.get("contentUrl", ""),
+                    "title": item.get("name", ""),
+                    "description": item.get("description", ""),
+                    "media_type": item.get("encodingFormat", ""),
+                }
+            )
+        return assets
+
+
+# Format checks in order of how often this plugin sees each format
+_FORMAT_CHECKS = (
+    # GeoCroissant
+    (
+        MetadataFormat.GEOCROISSANT,
+        lambda data: "recordSet" in data or "distribution" in data,
+    ),
+    # STAC
+    (
+        MetadataFormat.STAC,
+        lambda data: bool(data.get("stac_version"))
+        or (data.get("type") == "FeatureCollection" and "links" in data),
+    ),
+    # CMR-UMM (NASA)
+    (
+        MetadataFormat.CMR_UMM,
+        lambda data: "umm" in data and "meta" in data,
+    ),
+)
+
+# Accessor implementation for each detected format
+_FORMAT_IMPLS = {
+    MetadataFormat.CMR_UMM: _CmrUmmImpl,
+    MetadataFormat.STAC: _StacImpl,
+    MetadataFormat.GEOCROISSANT: _GeoCroissantImpl,
+    MetadataFormat.GENERIC: _FormatImpl,
+}
+
+
 class MetadataDetector:
     """Detects metadata format and provides format-agnostic interface."""
 
+    __slots__ = ("data", "format", "_impl")
+
     def __init__(self, data: Dict[str, Any]) -> None:
         """
         Initialize the detector.
 
+        The format-specific accessors are selected once here, so each
+        getter delegates without re-checking the format.
+
         :param data: Parsed JSON data
         """
         self.data = data
         self.format = self._detect_format()
+        self._impl = _FORMAT_IMPLS[self.format](data)
 
     def _detect_format(self) -> MetadataFormat:
         """
@@ -39,21 +393,11 @@ class MetadataDetector:
 
         :returns: MetadataFormat enum
         """
-        # Check for CMR-UMM format (NASA)
-        if "umm" in self.data and "meta" in self.data:
-            return MetadataFormat.CMR_UMM
-        
-        # Check for STAC format
-        if self.data.get("stac_version") or (
-            self.data.get("type") == "FeatureCollection" and 
-            "links" in self.data
-        ):
-            return MetadataFormat.STAC
-        
-        # Check for GeoCroissant format
-        if "recordSet" in self.data or "distribution" in self.data:
-            return MetadataFormat.GEOCROISSANT
-        
+        data = self.data
+        for metadata_format, matches in _FORMAT_CHECKS:
+            if matches(data):
+                return metadata_format
+
         # Default to generic
         return MetadataFormat.GENERIC
 
@@ -63,34 +407,11 @@ class MetadataDetector:
 
     def get_name(self) -> str:
         """Get dataset name from any format."""
-        if self.format == MetadataFormat.CMR_UMM:
-            # CMR-UMM format
-            umm = self.data.get("umm", {})
-            collection_ref = umm.get("CollectionReference", {})
-            return collection_ref.get("EntryTitle", 
-                   umm.get("GranuleUR", "Unknown Dataset"))
-        
-        elif self.format == MetadataFormat.STAC:
-            return self.data.get("title", self.data.get("id", "Unknown Dataset"))
-        
-        elif self.format == MetadataFormat.GEOCROISSANT:
-            return self.data.get("name", "Unknown Dataset")
-        
-        else:
-            return self.data.get("name", 
-                   self.data.get("title", 
-                   self.data.get("id", "Unknown Dataset")))
+        return self._impl.get_name()
 
     def get_description(self) -> str:
         """Get dataset description."""
-        if self.format == MetadataFormat.CMR_UMM:
-            umm = self.data.get("umm", {})
-            collection_ref = umm.get("CollectionReference", {})
-            entry_title = collection_ref.get("EntryTitle", "")
-            return entry_title if entry_title else ""
-        
-        return (self.data.get("description") or 
-                self.data.get("abstract") or "")
+        return self._impl.get_description()
 
     def get_spatial_extent(self) -> Optional[Dict[str, Any]]:
         """
@@ -98,48 +419,7 @@ class MetadataDetector:
 
         :returns: Dict with west, south, east, north or None
         """
-        if self.format == MetadataFormat.CMR_UMM:
-            umm = self.data.get("umm", {})
-            spatial = umm.get("SpatialExtent", {})
-            horizontal = spatial.get("HorizontalSpatialDomain", {})
-            geometry = horizontal.get("Geometry", {})
-            polygons = geometry.get("GPolygons", [])
-            
-            if polygons:
-                boundary = polygons[0].get("Boundary", {})
-                points = boundary.get("Points", [])
-                if points:
-                    lons = [p.get("Longitude", 0) for p in points]
-                    lats = [p.get("Latitude", 0) for p in points]
-                    return {
-                        "west": min(lons),
-                        "south": min(lats),
-                        "east": max(lons),
-                        "north": max(lats),
-                    }
-            return None
-        
-        elif self.format == MetadataFormat.STAC:
-            bbox = self.data.get("bbox")
-            if bbox and len(bbox) >= 4:
-                return {
-                    "west": bbox[0],
-                    "south": bbox[1],
-                    "east": bbox[2],
-                    "north": bbox[3],
-                }
-        
-        elif self.format == MetadataFormat.GEOCROISSANT:
-            bbox = self.data.get("geocr:BoundingBox")
-            if bbox and len(bbox) >= 4:
-                return {
-                    "west": bbox[0],
-                    "south": bbox[1],
-                    "east": bbox[2],
-                    "north": bbox[3],
-                }
-        
-        return None
+        return self._impl.get_spatial_extent()
 
     def get_temporal_extent(self) -> Optional[Dict[str, str]]:
         """
@@ -147,70 +427,15 @@ class MetadataDetector:
 
         :returns: Dict with start and end dates or None
         """
-        if self.format == MetadataFormat.CMR_UMM:
-            umm = self.data.get("umm", {})
-            temporal = umm.get("TemporalExtent", {})
-            range_dt = temporal.get("RangeDateTime", {})
-            
-            start = range_dt.get("BeginningDateTime")
-            end = range_dt.get("EndingDateTime")
-            
-            if start or end:
-                return {
-                    "start": start or "",
-                    "end": end or "",
-                }
-            return None
-        
-        elif self.format == MetadataFormat.STAC:
-            start = self.data.get("start_datetime")
-            end = self.data.get("end_datetime")
-            if start or end:
-                return {"start": start or "", "end": end or ""}
-        
-        elif self.format == MetadataFormat.GEOCROISSANT:
-            temporal = self.data.get("geocr:temporalExtent")
-            if temporal:
-                return temporal
-        
-        return None
+        return self._impl.get_temporal_extent()
 
     def get_crs(self) -> str:
         """Get coordinate reference system."""
-        if self.format == MetadataFormat.CMR_UMM:
-            umm = self.data.get("umm", {})
-            attributes = umm.get("AdditionalAttributes", [])
-            
-            for attr in attributes:
-                if attr.get("Name") == "HORIZONTAL_CS_CODE":
-                    values = attr.get("Values", [])
-                    if values:
-                        return values[0]
-            
-            return "EPSG:4326"
-        
-        elif self.format == MetadataFormat.GEOCROISSANT:
-            return self.data.get("geocr:coordinateReferenceSystem", "EPSG:4326")
-        
-        return "EPSG:4326"
+        return self._impl.get_crs()
 
     def get_spatial_resolution(self) -> Optional[str]:
         """Get spatial resolution."""
-        if self.format == MetadataFormat.CMR_UMM:
-            umm = self.data.get("umm", {})
-            attributes = umm.get("AdditionalAttributes", [])
-            
-            for attr in attributes:
-                if attr.get("Name") == "SPATIAL_RESOLUTION":
-                    values = attr.get("Values", [])
-                    if values:
-                        return f"{values[0]} m"
-            return None
-        
-        elif self.format == MetadataFormat.GEOCROISSANT:
-            return self.data.get("geocr:spatialResolution")
-        
-        return None
+        return self._impl.get_spatial_resolution()
 
     def get_download_urls(self) -> List[Dict[str, str]]:
         """
@@ -218,35 +443,7 @@ class MetadataDetector:
 
         :returns: List of dicts with 'url', 'name', 'type'
         """
-        urls = []
-        
-        if self.format == MetadataFormat.CMR_UMM:
-            umm = self.data.get("umm", {})
-            related_urls = umm.get("RelatedUrls", [])
-            
-            for url_obj in related_urls:
-                url_type = url_obj.get("Type", "")
-                if "GET DATA" in url_type or "DOWNLOAD" in url_type:
-                    urls.append({
-                        "url": url_obj.get("URL", ""),
-                        "name": url_obj.get("Description", ""),
-                        "type": url_type,
-                    })
-            
-            return urls
-        
-        elif self.format == MetadataFormat.GEOCROISSANT:
-            distribution = self.data.get("distribution", [])
-            for item in distribution:
-                if item.get("@type") == "cr:FileObject":
-                    urls.append({
-                        "url": item.get("contentUrl", ""),
-                        "name": item.get("name", ""),
-                        "type": item.get("encodingFormat", ""),
-                    })
-            return urls
-        
-        return []
+        return self._impl.get_download_urls()
 
     def get_metadata_items(self) -> List[Tuple[str, str]]:
         """
@@ -254,36 +451,7 @@ class MetadataDetector:
 
         :returns: List of (key, value) tuples
         """
-        items = []
-        
-        if self.format == MetadataFormat.CMR_UMM:
-            umm = self.data.get("umm", {})
-            
-            # Basic info
-            items.append(("Provider", self.data.get("meta", {}).get("provider-id", "-")))
-            items.append(("Concept ID", self.data.get("meta", {}).get("concept-id", "-")))
-            items.append(("Format", self.data.get("meta", {}).get("format", "-")))
-            
-            # Temporal
-            temporal = self.get_temporal_extent()
-            if temporal:
-                items.append(("Start Date", temporal.get("start", "-")))
-                items.append(("End Date", temporal.get("end", "-")))
-            
-            # Spatial attributes
-            attributes = umm.get("AdditionalAttributes", [])
-            attr_dict = {attr.get("Name"): attr.get("Values", []) for attr in attributes}
-            
-            for key in ["CLOUD_COVERAGE", "MGRS_TILE_ID", "SPATIAL_COVERAGE", "ACCODE"]:
-                if key in attr_dict and attr_dict[key]:
-                    items.append((key.replace("_", " "), str(attr_dict[key][0])))
-        
-        elif self.format == MetadataFormat.GEOCROISSANT:
-            items.append(("Version", self.data.get("version", "-")))
-            items.append(("License", self.data.get("license", "-")))
-            items.append(("Conforms To", self.data.get("conformsTo", "-")))
-        
-        return items
+        return self._impl.get_metadata_items()
 
     def get_assets(self) -> List[Dict[str, Any]]:
         """
@@ -291,38 +459,4 @@ class MetadataDetector:
 
         :returns: List of asset dicts
         """
-        assets = []
-        
-        if self.format == MetadataFormat.CMR_UMM:
-            urls = self.get_download_urls()
-            for i, url in enumerate(urls):
-                assets.append({
-                    "id": f"asset_{i}",
-                    "url": url.get("url"),
-                    "title": url.get("name"),
-                    "description": url.get("type"),
-                })
-        
-        elif self.format == MetadataFormat.STAC:
-            stac_assets = self.data.get("assets", {})
-            for asset_id, asset_info in stac_assets.items():
-                assets.append({
-                    "id": asset_id,
-                    "url": asset_info.get("href", ""),
-                    "title": asset_info.get("title", asset_id),
-                    "description": asset_info.get("description", ""),
-                    "media_type": asset_info.get("type", ""),
-                })
-        
-        elif self.format == MetadataFormat.GEOCROISSANT:
-            distribution = self.data.get("distribution", [])
-            for item in distribution:
-                assets.append({
-                    "id": item.get("@id", ""),
-                    "url": item.get("contentUrl", ""),
-                    "title": item.get("name", ""),
-                    "description": item.get("description", ""),
-                    "media_type": item.get("encodingFormat", ""),
-                })
-        
-        return assets
+        return self._impl.get_assets()
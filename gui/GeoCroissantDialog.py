@@ -12,10 +12,20 @@
 """
 
 import os
+import sys
 import webbrowser
-from typing import Optional, Dict, Any, List
-
-from qgis.PyQt.QtCore import QCoreApplication
+from functools import lru_cache
+from typing import Callable, Optional, Dict, Any, List, Tuple
+
+from qgis.PyQt.QtCore import (
+    QAbstractListModel,
+    QAbstractTableModel,
+    QCoreApplication,
+    QModelIndex,
+    QObject,
+    QThread,
+    pyqtSignal,
+)
 from qgis.PyQt.QtWidgets import (
     QAction,
     QDockWidget,
@@ -26,10 +36,11 @@ from qgis.PyQt.QtWidgets import (
     QFileDialog,
     QTableWidget,
     QTableWidgetItem,
+    QTableView,
+    QAbstractItemView,
     QGroupBox,
     QMessageBox,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QTabWidget,
     QWidget,
     QMenu,
@@ -37,7 +48,14 @@ from qgis.PyQt.QtWidgets import (
 from qgis.PyQt.QtCore import Qt
 
 from qgis.core import (
+    QgsApplication,
+    QgsCoordinateReferenceSystem,
+    QgsCoordinateTransform,
+    QgsCsException,
+    QgsMapLayer,
+    QgsMessageLog,
     QgsProject,
+    QgsTask,
     QgsVectorLayer,
     QgsRectangle,
     Qgis,
@@ -48,12 +66,38 @@ from GeoCroissantTools import PLUGIN_NAME, __version__, __email__, __web__, __he
 from GeoCroissantTools.utils import gui_utils
 from GeoCroissantTools.core.geocroissant_parser import GeoCroissantParser
 from GeoCroissantTools.core.layer_builder import BboxLayerBuilder
-from GeoCroissantTools.core.data_loader import COGLoader, CSVLoader, NetCDFLoader
+from GeoCroissantTools.core.data_loader import (
+    COGLoader,
+    CSVLoader,
+    MosaicLoader,
+    NetCDFLoader,
+)
+
+# Browser resolved once; webbrowser.open() repeats the lookup on every call
+try:
+    _BROWSER: Optional[webbrowser.BaseBrowser] = webbrowser.get()
+except webbrowser.Error:
+    _BROWSER = None
+
+
+def _open_url(url: str) -> bool:
+    """
+    Open a URL in a new browser tab.
+
+    :param url: URL to open
+    :returns: True if a browser was launched
+    """
+    try:
+        if _BROWSER is not None and _BROWSER.open(url, new=2):
+            return True
+        return webbrowser.open(url, new=2)
+    except webbrowser.Error:
+        return False
 
 
 def on_help_click() -> None:
     """Open help URL from button/menu entry."""
-    webbrowser.open(__help__)
+    _open_url(__help__)
 
 
 def on_about_click(parent) -> None:
@@ -79,6 +123,296 @@ def on_about_click(parent) -> None:
     )
 
 
+# Tab names in the order _setup_ui() adds the tabs
+_TAB_NAMES = ("info", "tiles", "files")
+
+# Tab titles shown in the tab bar
+_TAB_LABELS = {"info": "Info", "tiles": "Tiles", "files": "Files"}
+
+# Item data role holding the loader kind of a distribution file row
+_KIND_ROLE = Qt.UserRole + 1
+
+# Loader class per file kind; other kinds are opened in the browser
+_FILE_LOADERS = {"tiff": COGLoader, "csv": CSVLoader, "netcdf": NetCDFLoader}
+
+
+@lru_cache(maxsize=None)
+def _file_kind(encoding: str) -> str:
+    """
+    Classify a file by its encodingFormat.
+
+    Datasets use only a handful of encodings, so each is lowered and
+    matched once.
+
+    :param encoding: encodingFormat of a distribution file
+    :returns: "tiff", "csv", "netcdf" or "other"
+    """
+    encoding = encoding.lower()
+    if "tiff" in encoding:
+        return "tiff"
+    if "csv" in encoding:
+        return "csv"
+    if "netcdf" in encoding:
+        return "netcdf"
+    return "other"
+
+
+class _TileListModel(QAbstractListModel):
+    """Tile list that formats labels only for the rows a view requests."""
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        """
+        :param parent: Owning Qt object
+        """
+        super().__init__(parent)
+        self._items: List[Dict[str, Any]] = []
+        # Row labels, formatted the first time each row is displayed
+        self._labels: List[Optional[str]] = []
+        self._message: Optional[str] = None
+
+    def set_items(self, items: List[Dict[str, Any]]) -> None:
+        """
+        Show the given tile items.
+
+        :param items: Item dictionaries from GeoCroissantParser.get_items()
+        """
+        self.beginResetModel()
+        self._items = items
+        self._labels = [None] * len(items)
+        self._message = None
+        self.endResetModel()
+
+    def set_message(self, message: str) -> None:
+        """
+        Show a single informational row instead of tiles.
+
+        :param message: Text to display
+        """
+        self.beginResetModel()
+        self._items = []
+        self._labels = []
+        self._message = message
+        self.endResetModel()
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        self.set_items([])
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        if self._message is not None:
+            return 1
+        return len(self._items)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        if self._message is not None:
+            return self._message if role == Qt.DisplayRole else None
+
+        row = index.row()
+        if role == Qt.DisplayRole:
+            label = self._labels[row]
+            if label is None:
+                label = self._labels[row] = self._format_label(row)
+            return label
+        if role == Qt.UserRole:
+            return self._items[row]
+        return None
+
+    def _format_label(self, row: int) -> str:
+        """
+        Format the display label of a tile row.
+
+        :param row: Row index
+        :returns: Numbered tile ID with its lower-left corner
+        """
+        item = self._items[row]
+        item_id = item.get("id", "Unknown")
+        bbox = item.get("bbox", [])
+        bbox_str = f" [{bbox[0]:.1f}, {bbox[1]:.1f}]" if len(bbox) >= 2 else ""
+        return f"{row + 1}. {item_id}{bbox_str}"
+
+
+class _FilesTableModel(QAbstractTableModel):
+    """Distribution file table that formats cells only when displayed."""
+
+    _HEADERS = ("Name", "Type", "URL")
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        """
+        :param parent: Owning Qt object
+        """
+        super().__init__(parent)
+        self._assets: List[Dict[str, Any]] = []
+        # (name, type, truncated URL) per row, formatted on first display
+        self._rows: List[Optional[Tuple[str, str, str]]] = []
+
+    def set_assets(self, assets: List[Dict[str, Any]]) -> None:
+        """
+        Show the given assets or distribution file objects.
+
+        :param assets: Asset dicts or distribution file objects
+        """
+        self.beginResetModel()
+        self._assets = assets
+        self._rows = [None] * len(assets)
+        self.endResetModel()
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        self.set_assets([])
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._assets)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._HEADERS)
+
+    def headerData(
+        self, section: int, orientation: int, role: int = Qt.DisplayRole
+    ) -> Any:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        if role == Qt.UserRole:
+            return self._assets[row]
+        if role == _KIND_ROLE:
+            return _file_kind(self._assets[row].get("encodingFormat", ""))
+        if role != Qt.DisplayRole:
+            return None
+
+        cells = self._rows[row]
+        if cells is None:
+            cells = self._rows[row] = self._format_row(row)
+        return cells[index.column()]
+
+    def _format_row(self, row: int) -> Tuple[str, str, str]:
+        """
+        Format the display cells of a file row.
+
+        :param row: Row index
+        :returns: Tuple of (name, type, truncated URL)
+        """
+        # Handle both asset and file object formats
+        asset = self._assets[row]
+        name = asset.get("title") or asset.get("name") or asset.get("@id") or "Unknown"
+
+        # Only a handful of distinct types, so rows share one string each
+        file_type = sys.intern(
+            asset.get("media_type")
+            or asset.get("encodingFormat")
+            or asset.get("description")
+            or "Unknown"
+        )
+
+        # URL (truncated for display)
+        url = asset.get("url") or asset.get("contentUrl") or "-"
+        url_display = url[:60] + "..." if len(url) > 60 else url
+
+        return name, file_type, url_display
+
+
+class _LayerLoadTask(QgsTask):
+    """
+    Prepares a data loader's source in the background.
+
+    Downloads and GDAL probes run in run(); the layer itself is created in
+    finished() so no QObject is ever built off the main thread.
+    """
+
+    def __init__(
+        self,
+        description: str,
+        loader: Any,
+        on_loaded: Callable[[Optional[QgsMapLayer]], None],
+    ) -> None:
+        """
+        :param description: Task description shown in the task manager
+        :param loader: COGLoader, CSVLoader or NetCDFLoader instance
+        :param on_loaded: Called on the main thread with the layer, or None
+        """
+        super().__init__(description, QgsTask.CanCancel)
+        self.loader = loader
+        self.on_loaded = on_loaded
+        self.source: Optional[str] = None
+
+    def run(self) -> bool:
+        """Download or probe the layer source off the GUI thread."""
+        try:
+            self.source = self.loader.prepare()
+        except Exception as e:
+            QgsMessageLog.logMessage(
+                f"{self.description()} failed: {e}",
+                PLUGIN_NAME,
+                Qgis.MessageLevel.Critical,
+            )
+            return False
+
+        if self.source is None:
+            QgsMessageLog.logMessage(
+                f"{self.description()} failed: no readable source found",
+                PLUGIN_NAME,
+                Qgis.MessageLevel.Warning,
+            )
+            return False
+        return True
+
+    def finished(self, result: bool) -> None:
+        """Create the layer on the main thread and report it."""
+        layer = None
+        if result:
+            try:
+                layer = self.loader.create_layer(self.source)
+            except Exception as e:
+                QgsMessageLog.logMessage(
+                    f"{self.description()} failed: {e}",
+                    PLUGIN_NAME,
+                    Qgis.MessageLevel.Critical,
+                )
+        self.on_loaded(layer)
+
+
+class _ParserWorker(QObject):
+    """Parses a metadata file off the GUI thread."""
+
+    summary = pyqtSignal(object)
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+    def __init__(self, file_path: str) -> None:
+        """
+        :param file_path: Path to the metadata JSON file
+        """
+        super().__init__()
+        self.file_path = file_path
+
+    def run(self) -> None:
+        """Parse the file and emit the parser, or the error message."""
+        # Report the dataset summary before the full document is parsed;
+        # files peek() can't read are left to the full parse to report
+        try:
+            self.summary.emit(GeoCroissantParser.peek(self.file_path))
+        except Exception:
+            pass
+
+        try:
+            parser = GeoCroissantParser(self.file_path)
+            parser.build_index()
+        except Exception as e:
+            self.error.emit(str(e))
+        else:
+            self.finished.emit(parser)
+
+
 class GeoCroissantDialogMain:
     """Defines all mandatory QGIS plugin dialog components."""
 
@@ -99,6 +433,7 @@ class GeoCroissantDialogMain:
     def initGui(self) -> None:
         """Called when plugin is activated (on QGIS startup or in Plugin Manager)."""
 
+        gui_utils.prewarm_icons()
         icon_plugin = gui_utils.get_icon("geocr.jpg")
 
         self.actions = [
@@ -109,13 +444,13 @@ class GeoCroissantDialogMain:
             ),
             # About dialog
             QAction(
-                gui_utils.get_icon("icon_about.png"),
+                gui_utils.get_icon("icon_about.svg"),
                 self.tr("About"),
                 self.iface.mainWindow(),
             ),
             # Help page
             QAction(
-                gui_utils.get_icon("icon_help.png"),
+                gui_utils.get_icon("icon_help.svg"),
                 self.tr("Help"),
                 self.iface.mainWindow(),
             ),
@@ -160,6 +495,8 @@ class GeoCroissantDialogMain:
             del self.dlg
             self.dlg = None
 
+        gui_utils.clear_icon_cache()
+
     def _init_gui_control(self) -> None:
         """Slot for main plugin button. Initializes the GUI and shows it."""
 
@@ -194,7 +531,6 @@ class GeoCroissantDialog(QWidget):
         self.canvas = self._iface.mapCanvas()
 
         # Data storage
-        self.geocroissant_data: Optional[Dict[str, Any]] = None
         self.parser: Optional[GeoCroissantParser] = None
         self.current_file_path: Optional[str] = None
 
@@ -202,8 +538,30 @@ class GeoCroissantDialog(QWidget):
         self.tiles_layer: Optional[QgsVectorLayer] = None
         self.bbox_layer: Optional[QgsVectorLayer] = None
 
+        # Background parse in progress, if any
+        self._parse_thread: Optional[QThread] = None
+        self._parse_worker: Optional[_ParserWorker] = None
+
+        # Dataset CRS to project CRS, rebuilt on load and project CRS changes
+        self._extent_transform: Optional[QgsCoordinateTransform] = None
+        self.project.crsChanged.connect(self._update_extent_transform)
+
+        # Layer loads still running; held so the tasks outlive their handlers
+        self._load_tasks: List[_LayerLoadTask] = []
+
+        # (property, value) rows currently shown in the info table
+        self._last_info: List[Tuple[str, str]] = []
+
+        # Tabs already filled for the loaded dataset
+        self._populated: Dict[str, bool] = dict.fromkeys(_TAB_NAMES, False)
+
         self._setup_ui()
 
+    @property
+    def geocroissant_data(self) -> Optional[Dict[str, Any]]:
+        """Raw metadata of the loaded dataset, or None."""
+        return self.parser.data if self.parser else None
+
     def _setup_ui(self) -> None:
         """Set up the user interface."""
         main_layout = QVBoxLayout(self)
@@ -213,7 +571,7 @@ class GeoCroissantDialog(QWidget):
         load_layout = QHBoxLayout(load_group)
 
         self.btn_load = QPushButton("Browse...")
-        self.btn_load.setIcon(gui_utils.get_icon("icon_folder.png"))
+        self.btn_load.setIcon(gui_utils.get_icon("icon_folder.svg"))
         self.btn_load.clicked.connect(self._on_load_click)
 
         self.lbl_file = QLabel("No file loaded")
@@ -227,6 +585,10 @@ class GeoCroissantDialog(QWidget):
         # === Tab Widget ===
         self.tabs = QTabWidget()
 
+        # Models exist up front so a load can fill them before their views
+        self.tiles_model = _TileListModel(self)
+        self.files_model = _FilesTableModel(self)
+
         # --- Info Tab ---
         info_tab = QWidget()
         info_layout = QVBoxLayout(info_tab)
@@ -240,8 +602,8 @@ class GeoCroissantDialog(QWidget):
         info_layout.addWidget(self.info_table)
 
         # Spatial info
-        spatial_group = QGroupBox("Spatial Properties")
-        spatial_layout = QVBoxLayout(spatial_group)
+        self.spatial_group = QGroupBox("Spatial Properties")
+        spatial_layout = QVBoxLayout(self.spatial_group)
 
         self.lbl_bbox = QLabel("Bounding Box: -")
         self.lbl_crs = QLabel("CRS: -")
@@ -267,16 +629,39 @@ class GeoCroissantDialog(QWidget):
         btn_layout.addWidget(self.btn_zoom_extent)
         spatial_layout.addLayout(btn_layout)
 
-        info_layout.addWidget(spatial_group)
+        info_layout.addWidget(self.spatial_group)
+
+        self.tabs.addTab(info_tab, _TAB_LABELS["info"])
 
-        self.tabs.addTab(info_tab, "Info")
+        # --- Tiles and Files Tabs ---
+        # Placeholders until first shown; see _ensure_built()
+        self.tabs.addTab(QWidget(), _TAB_LABELS["tiles"])
+        self.tabs.addTab(QWidget(), _TAB_LABELS["files"])
+        self._built: Dict[str, bool] = {
+            "info": True,
+            "tiles": False,
+            "files": False,
+        }
 
-        # --- Tiles Tab ---
-        self.tiles_tab = QWidget()
-        tiles_layout = QVBoxLayout(self.tiles_tab)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
-        self.tiles_list = QListWidget()
-        self.tiles_list.itemDoubleClicked.connect(self._on_tile_double_click)
+        main_layout.addWidget(self.tabs, 1)
+
+        self.setLayout(main_layout)
+
+    def _build_tiles_tab(self) -> QWidget:
+        """
+        Build the Tiles tab.
+
+        :returns: Tab page widget
+        """
+        tiles_tab = QWidget()
+        tiles_layout = QVBoxLayout(tiles_tab)
+
+        self.tiles_list = QListView()
+        self.tiles_list.setModel(self.tiles_model)
+        self.tiles_list.setUniformItemSizes(True)
+        self.tiles_list.doubleClicked.connect(self._on_tile_double_click)
 
         tiles_btn_layout = QHBoxLayout()
         self.btn_show_tiles = QPushButton("Show All Tiles")
@@ -294,18 +679,22 @@ class GeoCroissantDialog(QWidget):
         tiles_layout.addWidget(self.tiles_list)
         tiles_layout.addLayout(tiles_btn_layout)
 
-        self.tabs.addTab(self.tiles_tab, "Tiles")
+        return tiles_tab
+
+    def _build_files_tab(self) -> QWidget:
+        """
+        Build the Files tab.
 
-        # --- Files Tab ---
+        :returns: Tab page widget
+        """
         files_tab = QWidget()
         files_layout = QVBoxLayout(files_tab)
 
-        self.files_table = QTableWidget()
-        self.files_table.setColumnCount(3)
-        self.files_table.setHorizontalHeaderLabels(["Name", "Type", "URL"])
+        self.files_table = QTableView()
+        self.files_table.setModel(self.files_model)
         self.files_table.horizontalHeader().setStretchLastSection(True)
-        self.files_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.files_table.itemDoubleClicked.connect(self._on_file_double_click)
+        self.files_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.files_table.doubleClicked.connect(self._on_file_double_click)
 
         files_layout.addWidget(QLabel("Distribution Files (double-click to load):"))
         files_layout.addWidget(self.files_table)
@@ -324,11 +713,65 @@ class GeoCroissantDialog(QWidget):
         files_btn_layout.addWidget(self.btn_load_selected_csv)
         files_layout.addLayout(files_btn_layout)
 
-        self.tabs.addTab(files_tab, "Files")
+        return files_tab
 
-        main_layout.addWidget(self.tabs, 1)
+    def _on_tab_changed(self, index: int) -> None:
+        """
+        Build and fill a tab the first time it is shown.
 
-        self.setLayout(main_layout)
+        :param index: Index of the tab that became current
+        """
+        self._ensure_built(index)
+        self._ensure_populated(index)
+
+    def _ensure_built(self, index: int) -> None:
+        """
+        Replace a placeholder tab with its real page.
+
+        :param index: Tab index
+        """
+        if not 0 <= index < len(_TAB_NAMES):
+            return
+
+        name = _TAB_NAMES[index]
+        if self._built[name]:
+            return
+        self._built[name] = True
+
+        page = self._build_tiles_tab() if name == "tiles" else self._build_files_tab()
+
+        # Swapping the current page would re-enter currentChanged
+        self.tabs.blockSignals(True)
+        try:
+            placeholder = self.tabs.widget(index)
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, page, _TAB_LABELS[name])
+            self.tabs.setCurrentIndex(index)
+            placeholder.deleteLater()
+        finally:
+            self.tabs.blockSignals(False)
+
+        self._apply_dataset_state()
+
+    def _apply_dataset_state(self) -> None:
+        """Enable the widgets that depend on the loaded dataset."""
+        if not self.parser:
+            return
+
+        # Conditionally enable Tiles tab based on dataset type
+        is_tile_based = self.parser.get_dataset_type() == "tiles"
+        has_items = self.parser.get_item_count() > 0
+
+        self.tabs.widget(_TAB_NAMES.index("tiles")).setEnabled(is_tile_based)
+        self.btn_show_bbox.setEnabled(True)
+        self.btn_zoom_extent.setEnabled(True)
+
+        if self._built["tiles"]:
+            self.btn_show_tiles.setEnabled(is_tile_based)
+            self.btn_load_tile.setEnabled(is_tile_based)
+        if self._built["files"]:
+            self.btn_load_selected_cog.setEnabled(has_items)
+            self.btn_load_selected_csv.setEnabled(has_items)
 
     def _on_load_click(self) -> None:
         """Handle load button click."""
@@ -343,41 +786,77 @@ class GeoCroissantDialog(QWidget):
             self._load_geocroissant(file_path)
 
     def _load_geocroissant(self, file_path: str) -> None:
-        """Load and parse a metadata file (any supported format)."""
+        """Parse a metadata file (any supported format) on a worker thread."""
+        if self._parse_thread is not None:
+            return
+
+        self.btn_load.setEnabled(False)
+        self.lbl_file.setText(f"Loading {os.path.basename(file_path)}...")
+
+        thread = QThread(self)
+        worker = _ParserWorker(file_path)
+        worker.moveToThread(thread)
+
+        thread.started.connect(worker.run)
+        worker.summary.connect(self._on_peeked)
+        worker.finished.connect(self._on_parsed)
+        worker.error.connect(self._on_parse_error)
+        worker.finished.connect(thread.quit)
+        worker.error.connect(thread.quit)
+        thread.finished.connect(self._on_parse_thread_finished)
+
+        self._parse_thread = thread
+        self._parse_worker = worker
+        thread.start()
+
+    def _on_parse_thread_finished(self) -> None:
+        """Release the finished parse thread and re-enable loading."""
+        self._parse_worker.deleteLater()
+        self._parse_thread.deleteLater()
+        self._parse_worker = None
+        self._parse_thread = None
+        self.btn_load.setEnabled(True)
+
+    def _on_peeked(self, summary: Dict[str, Any]) -> None:
+        """Show the dataset name and version while the full parse runs."""
+        name = summary.get("name")
+        if not name:
+            return
+
+        version = summary.get("version")
+        label = f"{name} v{version}" if version else str(name)
+        self.lbl_file.setText(f"Loading {label}...")
+
+    def _on_parse_error(self, message: str) -> None:
+        """Report a failed background parse."""
+        self.lbl_file.setText("No file loaded")
+        QMessageBox.critical(
+            self,
+            "Error Loading File",
+            f"Failed to load metadata file:\n{message}",
+        )
+
+    def _on_parsed(self, parser: GeoCroissantParser) -> None:
+        """Populate the dialog from a parser built on the worker thread."""
         try:
-            self.parser = GeoCroissantParser(file_path)
-            self.geocroissant_data = self.parser.data
+            file_path = parser.file_path
+            self.parser = parser
             self.current_file_path = file_path
 
             # Update UI
             file_name = os.path.basename(file_path)
             metadata_format = self.parser.get_format()
             self.lbl_file.setText(f"{file_name} ({metadata_format})")
-            
-            self._populate_info()
-            self._populate_tiles()
-            self._populate_files()
 
-            # Conditionally enable Tiles tab based on dataset type
-            dataset_type = self.parser.get_dataset_type()
-            is_tile_based = dataset_type == "tiles"
-            
-            self.tiles_tab.setEnabled(is_tile_based)
-            if not is_tile_based:
-                self.tiles_list.clear()
-                msg = "This dataset contains files. Use the Files tab to load data."
-                
-                # Specific message for CMR-UMM format
-                if metadata_format == "cmr_umm":
-                    msg = "CMR-UMM format detected. View available assets in the Files tab."
-                
-                self.tiles_list.addItem(QListWidgetItem(msg))
+            # Tabs are filled when first shown; drop the previous dataset's rows
+            self._populated = dict.fromkeys(self._populated, False)
+            self.tiles_model.clear()
+            self.files_model.clear()
+            self._ensure_populated(self.tabs.currentIndex())
+            self._update_extent_transform()
 
             # Enable buttons
-            self.btn_show_bbox.setEnabled(True)
-            self.btn_zoom_extent.setEnabled(True)
-            self.btn_show_tiles.setEnabled(is_tile_based)
-            self.btn_load_tile.setEnabled(is_tile_based)
+            self._apply_dataset_state()
 
             # Show success message with format info
             success_msg = f"Loaded: {self.parser.get_name()} ({metadata_format.upper()})"
@@ -389,12 +868,34 @@ class GeoCroissantDialog(QWidget):
             )
 
         except Exception as e:
+            self.lbl_file.setText("No file loaded")
             QMessageBox.critical(
                 self,
                 "Error Loading File",
                 f"Failed to load metadata file:\n{str(e)}",
             )
 
+    def _ensure_populated(self, index: int) -> None:
+        """
+        Fill a tab the first time it is shown for the loaded dataset.
+
+        :param index: Index of the tab that became current
+        """
+        if not self.parser or not 0 <= index < len(_TAB_NAMES):
+            return
+
+        name = _TAB_NAMES[index]
+        if self._populated[name]:
+            return
+        self._populated[name] = True
+
+        if name == "info":
+            self._populate_info()
+        elif name == "tiles":
+            self._populate_tiles()
+        elif name == "files":
+            self._populate_files()
+
     def _populate_info(self) -> None:
         """Populate the info table with dataset metadata dynamically."""
         if not self.parser:
@@ -418,63 +919,86 @@ class GeoCroissantDialog(QWidget):
             if value and value != "-":
                 info_items.append((key, str(value)[:100]))
 
-        self.info_table.setRowCount(len(info_items))
-        for i, (key, value) in enumerate(info_items):
-            self.info_table.setItem(i, 0, QTableWidgetItem(key))
-            self.info_table.setItem(
-                i, 1, QTableWidgetItem(str(value) if value else "-")
-            )
+        item_count = self.parser.get_item_count()
+        if item_count:
+            info_items.append(("Items", str(item_count)))
+
+        rows = [(key, str(value) if value else "-") for key, value in info_items]
+        last_rows = self._last_info
+
+        # Only touch cells that differ from what is shown, without a
+        # relayout or repaint per setItem()
+        table = self.info_table
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            if len(rows) != len(last_rows):
+                table.setRowCount(len(rows))
+            for i, row in enumerate(rows):
+                last_row = last_rows[i] if i < len(last_rows) else (None, None)
+                for column in (0, 1):
+                    if row[column] != last_row[column]:
+                        table.setItem(i, column, QTableWidgetItem(row[column]))
+            self._last_info = rows
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+            table.viewport().update()
 
         # Spatial properties
         bbox = self.parser.get_bounding_box()
         if bbox:
-            self.lbl_bbox.setText(
-                f"Bounding Box: [{bbox[0]:.4f}, {bbox[1]:.4f}, {bbox[2]:.4f}, {bbox[3]:.4f}]"
+            west, south, east, north = map(float, bbox[:4])
+            bbox_text = (
+                f"Bounding Box: [{west:.4f}, {south:.4f}, {east:.4f}, {north:.4f}]"
             )
         else:
-            self.lbl_bbox.setText("Bounding Box: -")
+            bbox_text = "Bounding Box: -"
 
-        crs = self.parser.get_crs()
-        self.lbl_crs.setText(f"CRS: {crs}")
-        
         resolution = self.parser.get_spatial_resolution()
-        self.lbl_resolution.setText(
-            f"Resolution: {resolution}" if resolution else "Resolution: Unknown"
-        )
 
         temporal = self.parser.get_temporal_extent()
         if temporal:
             start = temporal.get('startDate') or temporal.get('start', '?')
             end = temporal.get('endDate') or temporal.get('end', '?')
-            self.lbl_temporal.setText(
-                f"Temporal: {start} → {end}"
-            )
+            temporal_text = f"Temporal: {start} → {end}"
         else:
-            self.lbl_temporal.setText("Temporal: -")
+            temporal_text = "Temporal: -"
+
+        # Relayout the group once rather than after each label
+        self.spatial_group.setUpdatesEnabled(False)
+        try:
+            self.lbl_bbox.setText(bbox_text)
+            self.lbl_crs.setText(f"CRS: {self.parser.get_crs()}")
+            self.lbl_resolution.setText(
+                f"Resolution: {resolution}" if resolution else "Resolution: Unknown"
+            )
+            self.lbl_temporal.setText(temporal_text)
+        finally:
+            self.spatial_group.setUpdatesEnabled(True)
 
     def _populate_tiles(self) -> None:
         """Populate the tiles list from recordSet items."""
-        self.tiles_list.clear()
+        self.tiles_model.clear()
 
         if not self.parser:
             return
 
-        items = self.parser.get_items()
-        for idx, item in enumerate(items, 1):
-            item_id = item.get("id", "Unknown")
-            bbox = item.get("bbox", [])
-            bbox_str = f" [{bbox[0]:.1f}, {bbox[1]:.1f}]" if len(bbox) >= 2 else ""
+        if self.parser.get_dataset_type() != "tiles":
+            msg = "This dataset contains files. Use the Files tab to load data."
 
-            list_item = QListWidgetItem(f"{idx}. {item_id}{bbox_str}")
-            list_item.setData(Qt.UserRole, item)
-            self.tiles_list.addItem(list_item)
+            # Specific message for CMR-UMM format
+            if self.parser.get_format() == "cmr_umm":
+                msg = "CMR-UMM format detected. View available assets in the Files tab."
 
-        self.btn_load_selected_cog.setEnabled(len(items) > 0)
-        self.btn_load_selected_csv.setEnabled(len(items) > 0)
+            self.tiles_model.set_message(msg)
+            return
+
+        self.tiles_model.set_items(self.parser.get_items())
 
     def _populate_files(self) -> None:
         """Populate the files table from any format dynamically."""
-        self.files_table.setRowCount(0)
+        self.files_model.clear()
 
         if not self.parser:
             return
@@ -485,26 +1009,35 @@ class GeoCroissantDialog(QWidget):
         if not assets:
             # Fallback to distribution files if no assets found
             assets = self.parser.get_distribution_files()
-        
-        self.files_table.setRowCount(len(assets))
 
-        for i, asset in enumerate(assets):
-            # Handle both asset and file object formats
-            name = asset.get("title") or asset.get("name") or asset.get("@id") or "Unknown"
-            file_type = asset.get("media_type") or asset.get("encodingFormat") or asset.get("description") or "Unknown"
-            url = asset.get("url") or asset.get("contentUrl") or "-"
+        self.files_model.set_assets(assets)
 
-            # Display name
-            self.files_table.setItem(i, 0, QTableWidgetItem(name))
-            
-            # File type
-            self.files_table.setItem(i, 1, QTableWidgetItem(file_type))
+    def _find_cog_file(self, tile_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the COG/GeoTIFF distribution file of a tile.
+
+        :param tile_id: The item/tile ID
+        :returns: Matching file object or None
+        """
+        cog_file = self.parser.find_distribution_file(tile_id, "cog")
+        if not cog_file:
+            cog_file = self.parser.find_distribution_file(tile_id, ".tif")
+        return cog_file
+
+    def _current_tile(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the item of the selected tile row.
+
+        :returns: Item dictionary or None if no tile is selected
+        """
+        # The tile list only exists once the Tiles tab has been opened
+        if not self._built["tiles"]:
+            return None
 
-            # URL (truncated for display)
-            url_display = url[:60] + "..." if len(url) > 60 else url
-            url_item = QTableWidgetItem(url_display)
-            url_item.setData(Qt.UserRole, asset)
-            self.files_table.setItem(i, 2, url_item)
+        index = self.tiles_list.currentIndex()
+        if not index.isValid():
+            return None
+        return index.data(Qt.UserRole)
 
     def _on_show_bbox_click(self) -> None:
         """Show the dataset bounding box on the map."""
@@ -531,6 +1064,35 @@ class GeoCroissantDialog(QWidget):
                 duration=2,
             )
 
+    def _update_extent_transform(self) -> None:
+        """Rebuild the dataset-to-project transform used for zooming."""
+        self._extent_transform = None
+        if not self.parser:
+            return
+
+        source_crs = QgsCoordinateReferenceSystem(self.parser.get_crs())
+        project_crs = self.project.crs()
+        if source_crs.isValid() and project_crs.isValid() and source_crs != project_crs:
+            self._extent_transform = QgsCoordinateTransform(
+                source_crs, project_crs, self.project
+            )
+
+    def _zoom_to_bbox(self, bbox: List[float]) -> None:
+        """
+        Zoom the canvas to a bounding box given in the dataset CRS.
+
+        :param bbox: [west, south, east, north] in the dataset CRS
+        """
+        rect = QgsRectangle(bbox[0], bbox[1], bbox[2], bbox[3])
+        if self._extent_transform is not None:
+            try:
+                rect = self._extent_transform.transformBoundingBox(rect)
+            except QgsCsException:
+                pass
+
+        self.canvas.setExtent(rect)
+        self.canvas.refresh()
+
     def _on_zoom_extent_click(self) -> None:
         """Zoom to the dataset extent."""
         if not self.parser:
@@ -540,10 +1102,7 @@ class GeoCroissantDialog(QWidget):
         if not bbox:
             return
 
-        rect = QgsRectangle(bbox[0], bbox[1], bbox[2], bbox[3])
-
-        self.canvas.setExtent(rect)
-        self.canvas.refresh()
+        self._zoom_to_bbox(bbox)
 
     def _on_show_tiles_click(self) -> None:
         """Load all tile COG images."""
@@ -557,31 +1116,77 @@ class GeoCroissantDialog(QWidget):
             )
             return
 
-        loaded_count = 0
         failed_count = 0
+        tiles = []
 
         for item in items:
             tile_id = item.get("id", "")
             
             # Find matching COG file
-            cog_file = self.parser.find_distribution_file(tile_id, "cog")
-            if not cog_file:
-                cog_file = self.parser.find_distribution_file(tile_id, ".tif")
+            cog_file = self._find_cog_file(tile_id)
 
             if cog_file:
-                url = cog_file.get("contentUrl", "")
-                loader = COGLoader(url, tile_id)
-                layer = loader.load()
+                tiles.append((tile_id, cog_file.get("contentUrl", "")))
+            else:
+                failed_count += 1
 
-                if layer and layer.isValid():
-                    self.project.addMapLayer(layer)
-                    loaded_count += 1
-                else:
-                    failed_count += 1
+        if not tiles:
+            self._report_tiles_loaded(0, failed_count)
+            return
+
+        # Load all tiles as one VRT mosaic, falling back to one layer per tile
+        loader = MosaicLoader(
+            [url for _, url in tiles], f"{self.parser.get_name()}_mosaic"
+        )
+
+        def on_mosaic_loaded(layer: Optional[QgsMapLayer]) -> None:
+            if layer:
+                self.project.addMapLayer(layer)
+                # Tiles BuildVRT skipped are not in the mosaic
+                self._report_tiles_loaded(
+                    loader.tile_count, failed_count + len(tiles) - loader.tile_count
+                )
+            else:
+                self._load_tiles_separately(tiles, failed_count)
+
+        self._load_layer_async(loader, "Building tile mosaic", on_mosaic_loaded)
+
+    def _load_tiles_separately(
+        self, tiles: List[Tuple[str, str]], failed_count: int
+    ) -> None:
+        """
+        Load each tile as its own layer and report once all have finished.
+
+        :param tiles: (tile id, COG URL) pairs to load
+        :param failed_count: Tiles that already failed before loading
+        """
+        layers: List[QgsMapLayer] = []
+        pending = len(tiles)
+
+        def on_loaded(layer: Optional[QgsMapLayer]) -> None:
+            nonlocal pending, failed_count
+            pending -= 1
+            if layer:
+                layers.append(layer)
             else:
                 failed_count += 1
 
-        # Show summary message
+            if pending == 0:
+                self._add_layers(layers)
+                self._report_tiles_loaded(len(layers), failed_count)
+
+        for tile_id, url in tiles:
+            self._load_layer_async(
+                COGLoader(url, tile_id), f"Loading tile {tile_id}", on_loaded
+            )
+
+    def _report_tiles_loaded(self, loaded_count: int, failed_count: int) -> None:
+        """
+        Show a summary of a bulk tile load in the message bar.
+
+        :param loaded_count: Tiles added to the project
+        :param failed_count: Tiles that could not be loaded
+        """
         message = f"Loaded {loaded_count} tiles"
         if failed_count > 0:
             message += f" ({failed_count} failed)"
@@ -593,58 +1198,94 @@ class GeoCroissantDialog(QWidget):
             duration=3,
         )
 
-    def _on_tile_double_click(self, item: QListWidgetItem) -> None:
+    def _add_layers(self, layers: List[QgsMapLayer]) -> None:
+        """
+        Add several layers to the project with a single canvas refresh.
+
+        :param layers: Valid map layers to add
+        """
+        if not layers:
+            return
+
+        self.canvas.freeze(True)
+        try:
+            self.project.addMapLayers(layers, True)
+        finally:
+            self.canvas.freeze(False)
+        self.canvas.refresh()
+
+    def _on_tile_double_click(self, index: QModelIndex) -> None:
         """Zoom to a specific tile."""
-        tile_data = item.data(Qt.UserRole)
+        tile_data = index.data(Qt.UserRole)
         if not tile_data:
             return
 
         bbox = tile_data.get("bbox", [])
         if len(bbox) >= 4:
-            rect = QgsRectangle(bbox[0], bbox[1], bbox[2], bbox[3])
-            self.canvas.setExtent(rect)
-            self.canvas.refresh()
+            self._zoom_to_bbox(bbox)
+
+    def _load_layer_async(
+        self,
+        loader: Any,
+        description: str,
+        on_loaded: Callable[[Optional[QgsMapLayer]], None],
+    ) -> None:
+        """
+        Load a layer on a QgsTask and report it back on the main thread.
+
+        :param loader: COGLoader, CSVLoader or NetCDFLoader instance
+        :param description: Task description shown in the task manager
+        :param on_loaded: Called with the valid layer, or None on failure
+        """
+
+        def finished(layer: Optional[QgsMapLayer]) -> None:
+            self._load_tasks.remove(task)
+            on_loaded(layer)
+
+        task = _LayerLoadTask(description, loader, finished)
+        self._load_tasks.append(task)
+        QgsApplication.taskManager().addTask(task)
 
     def _on_load_tile_click(self) -> None:
         """Load COG for selected tile and zoom to it."""
-        current_item = self.tiles_list.currentItem()
-        if not current_item or not self.parser:
+        tile_data = self._current_tile()
+        if not tile_data or not self.parser:
             return
 
-        tile_data = current_item.data(Qt.UserRole)
         tile_id = tile_data.get("id", "")
 
         # Find matching COG file
-        cog_file = self.parser.find_distribution_file(tile_id, "cog")
-        if not cog_file:
-            cog_file = self.parser.find_distribution_file(tile_id, ".tif")
+        cog_file = self._find_cog_file(tile_id)
 
         if cog_file:
             url = cog_file.get("contentUrl", "")
-            loader = COGLoader(url, tile_id)
-            layer = loader.load()
 
-            if layer and layer.isValid():
-                self.project.addMapLayer(layer)
-                
-                # Zoom to the loaded layer
-                extent = layer.extent()
-                self.canvas.setExtent(extent)
-                self.canvas.refresh()
-                
-                self._iface.messageBar().pushMessage(
-                    PLUGIN_NAME,
-                    f"Loaded tile: {tile_id}",
-                    level=Qgis.MessageLevel.Success,
-                    duration=3,
-                )
-            else:
-                self._iface.messageBar().pushMessage(
-                    PLUGIN_NAME,
-                    f"Failed to load tile: {tile_id}",
-                    level=Qgis.MessageLevel.Warning,
-                    duration=3,
-                )
+            def on_loaded(layer: Optional[QgsMapLayer]) -> None:
+                if layer:
+                    self.project.addMapLayer(layer)
+
+                    # Zoom to the loaded layer
+                    extent = layer.extent()
+                    self.canvas.setExtent(extent)
+                    self.canvas.refresh()
+
+                    self._iface.messageBar().pushMessage(
+                        PLUGIN_NAME,
+                        f"Loaded tile: {tile_id}",
+                        level=Qgis.MessageLevel.Success,
+                        duration=3,
+                    )
+                else:
+                    self._iface.messageBar().pushMessage(
+                        PLUGIN_NAME,
+                        f"Failed to load tile: {tile_id}",
+                        level=Qgis.MessageLevel.Warning,
+                        duration=3,
+                    )
+
+            self._load_layer_async(
+                COGLoader(url, tile_id), f"Loading tile {tile_id}", on_loaded
+            )
         else:
             self._iface.messageBar().pushMessage(
                 PLUGIN_NAME,
@@ -655,41 +1296,41 @@ class GeoCroissantDialog(QWidget):
 
     def _on_load_cog_click(self) -> None:
         """Load COG for selected tile."""
-        current_item = self.tiles_list.currentItem()
-        if not current_item or not self.parser:
+        tile_data = self._current_tile()
+        if not tile_data or not self.parser:
             return
 
-        tile_data = current_item.data(Qt.UserRole)
         tile_id = tile_data.get("id", "")
 
         # Find matching COG file
-        cog_file = self.parser.find_distribution_file(tile_id, "cog")
-        if not cog_file:
-            cog_file = self.parser.find_distribution_file(tile_id, ".tif")
+        cog_file = self._find_cog_file(tile_id)
 
         if cog_file:
             url = cog_file.get("contentUrl", "")
-            loader = COGLoader(url, tile_id)
-            layer = loader.load()
 
-            if layer and layer.isValid():
-                self.project.addMapLayer(layer)
-                
-                # Zoom to the loaded layer
-                extent = layer.extent()
-                self.canvas.setExtent(extent)
-                self.canvas.refresh()
-                
-                self._iface.messageBar().pushMessage(
-                    PLUGIN_NAME,
-                    f"Loaded COG: {tile_id}",
-                    level=Qgis.MessageLevel.Success,
-                    duration=3,
-                )
-            else:
-                QMessageBox.warning(
-                    self, "Load Failed", f"Could not load COG from: {url}"
-                )
+            def on_loaded(layer: Optional[QgsMapLayer]) -> None:
+                if layer:
+                    self.project.addMapLayer(layer)
+
+                    # Zoom to the loaded layer
+                    extent = layer.extent()
+                    self.canvas.setExtent(extent)
+                    self.canvas.refresh()
+
+                    self._iface.messageBar().pushMessage(
+                        PLUGIN_NAME,
+                        f"Loaded COG: {tile_id}",
+                        level=Qgis.MessageLevel.Success,
+                        duration=3,
+                    )
+                else:
+                    QMessageBox.warning(
+                        self, "Load Failed", f"Could not load COG from: {url}"
+                    )
+
+            self._load_layer_async(
+                COGLoader(url, tile_id), f"Loading COG {tile_id}", on_loaded
+            )
         else:
             QMessageBox.warning(
                 self, "No COG Found", f"No COG file found for tile: {tile_id}"
@@ -697,11 +1338,10 @@ class GeoCroissantDialog(QWidget):
 
     def _on_load_csv_click(self) -> None:
         """Load CSV for selected tile."""
-        current_item = self.tiles_list.currentItem()
-        if not current_item or not self.parser:
+        tile_data = self._current_tile()
+        if not tile_data or not self.parser:
             return
 
-        tile_data = current_item.data(Qt.UserRole)
         tile_id = tile_data.get("id", "")
 
         # Find matching CSV file
@@ -709,65 +1349,53 @@ class GeoCroissantDialog(QWidget):
 
         if csv_file:
             url = csv_file.get("contentUrl", "")
-            loader = CSVLoader(url, tile_id)
-            layer = loader.load()
 
-            if layer and layer.isValid():
-                self.project.addMapLayer(layer)
-                
-                # Zoom to the loaded layer
-                extent = layer.extent()
-                self.canvas.setExtent(extent)
-                self.canvas.refresh()
-                
-                self._iface.messageBar().pushMessage(
-                    PLUGIN_NAME,
-                    f"Loaded CSV: {tile_id}",
-                    level=Qgis.MessageLevel.Success,
-                    duration=3,
-                )
-            else:
-                QMessageBox.warning(
-                    self, "Load Failed", f"Could not load CSV from: {url}"
-                )
+            def on_loaded(layer: Optional[QgsMapLayer]) -> None:
+                if layer:
+                    self.project.addMapLayer(layer)
+
+                    # Zoom to the loaded layer
+                    extent = layer.extent()
+                    self.canvas.setExtent(extent)
+                    self.canvas.refresh()
+
+                    self._iface.messageBar().pushMessage(
+                        PLUGIN_NAME,
+                        f"Loaded CSV: {tile_id}",
+                        level=Qgis.MessageLevel.Success,
+                        duration=3,
+                    )
+                else:
+                    QMessageBox.warning(
+                        self, "Load Failed", f"Could not load CSV from: {url}"
+                    )
+
+            self._load_layer_async(
+                CSVLoader(url, tile_id), f"Loading CSV {tile_id}", on_loaded
+            )
         else:
             QMessageBox.warning(
                 self, "No CSV Found", f"No CSV file found for tile: {tile_id}"
             )
 
-    def _on_file_double_click(self, item: QTableWidgetItem) -> None:
+    def _on_file_double_click(self, index: QModelIndex) -> None:
         """Load a file from the distribution table."""
-        row = item.row()
-        url_item = self.files_table.item(row, 2)
-        if not url_item:
-            return
-
-        file_obj = url_item.data(Qt.UserRole)
+        file_obj = index.data(Qt.UserRole)
         if not file_obj:
             return
 
         url = file_obj.get("contentUrl", "")
-        encoding = file_obj.get("encodingFormat", "")
+        kind = index.data(_KIND_ROLE)
         name = file_obj.get("name", file_obj.get("@id", "layer"))
 
-        if "tiff" in encoding.lower() or "geotiff" in encoding.lower():
-            loader = COGLoader(url, name)
-            layer = loader.load()
-            if layer and layer.isValid():
-                self.project.addMapLayer(layer)
-                self._iface.mapCanvas().setExtent(layer.extent())
-        elif "csv" in encoding.lower():
-            loader = CSVLoader(url, name)
-            layer = loader.load()
-            if layer and layer.isValid():
-                self.project.addMapLayer(layer)
-                self._iface.mapCanvas().setExtent(layer.extent())
-        elif "netcdf" in encoding.lower():
-            loader = NetCDFLoader(url, name)
-            layer = loader.load()
-            if layer and layer.isValid():
+        def on_loaded(layer: Optional[QgsMapLayer]) -> None:
+            if layer:
                 self.project.addMapLayer(layer)
                 self._iface.mapCanvas().setExtent(layer.extent())
+
+        def on_netcdf_loaded(layer: Optional[QgsMapLayer]) -> None:
+            if layer:
+                on_loaded(layer)
             else:
                 QMessageBox.warning(
                     self,
@@ -775,7 +1403,14 @@ class GeoCroissantDialog(QWidget):
                     f"Could not load NetCDF file. File may need to be opened manually in QGIS.\n"
                     f"URL: {url}"
                 )
-        else:
-            webbrowser.open(url)
 
+        loader_class = _FILE_LOADERS.get(kind)
+        if loader_class is None:
+            _open_url(url)
+            return
 
+        self._load_layer_async(
+            loader_class(url, name),
+            f"Loading {name}",
+            on_netcdf_loaded if kind == "netcdf" else on_loaded,
+        )
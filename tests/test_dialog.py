@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the GeoCroissant dock dialog
+
+Run with: python -m pytest tests/test_dialog.py -v
+Requires QGIS and the plugin installed as the GeoCroissantTools package.
+"""
+
+import importlib.util
+import unittest
+from types import SimpleNamespace
+
+_HAS_PLUGIN = (
+    importlib.util.find_spec("qgis") is not None
+    and importlib.util.find_spec("GeoCroissantTools") is not None
+)
+
+if _HAS_PLUGIN:
+    from GeoCroissantTools.gui.GeoCroissantDialog import GeoCroissantDialog
+
+
+@unittest.skipUnless(_HAS_PLUGIN, "QGIS or the GeoCroissantTools package not available")
+class TestGeoCroissantDialog(unittest.TestCase):
+    """Test cases for GeoCroissantDialog."""
+
+    def test_current_tile_before_tiles_tab_is_built(self):
+        """Test that no tile is selected while the Tiles tab is a placeholder."""
+        dialog = SimpleNamespace(_built={"info": True, "tiles": False, "files": True})
+        self.assertIsNone(GeoCroissantDialog._current_tile(dialog))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,13 +10,16 @@ import os
 import json
 import tempfile
 import unittest
+import importlib.util
 import sys
+from unittest import mock
 
 # Add parent directory to path
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, parent_dir)
 
 # Import from the parent package
+from core import geocroissant_parser  # noqa: E402
 from core.geocroissant_parser import GeoCroissantParser  # noqa: E402
 
 
@@ -87,18 +90,14 @@ class TestGeoCroissantParser(unittest.TestCase):
             ],
         }
 
-        # Create temporary file
-        self.temp_file = tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False
-        )
-        json.dump(self.sample_data, self.temp_file)
-        self.temp_file.close()
-
-        self.parser = GeoCroissantParser(self.temp_file.name)
+        self.parser = GeoCroissantParser.from_dict(self.sample_data)
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        os.unlink(self.temp_file.name)
+    def _write_temp_file(self, data):
+        """Write data to a temporary JSON file removed after the test."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump(data, f)
+        self.addCleanup(os.unlink, f.name)
+        return f.name
 
     def test_get_name(self):
         """Test getting dataset name."""
@@ -166,6 +165,63 @@ class TestGeoCroissantParser(unittest.TestCase):
         self.assertIsNotNone(csv_file)
         self.assertIn("csv", csv_file["contentUrl"])
 
+    def test_load_from_file(self):
+        """Test that parsing from disk matches the in-memory parser."""
+        parser = GeoCroissantParser(self._write_temp_file(self.sample_data))
+        self.assertEqual(parser.data, self.sample_data)
+        self.assertEqual(parser.get_name(), "Test Dataset")
+        self.assertEqual(parser.get_license(), "CC-BY-4.0")
+
+    def test_parsed_data_is_cached(self):
+        """Test that reopening an unchanged file reuses the parsed data."""
+        path = self._write_temp_file(self.sample_data)
+        self.assertIs(GeoCroissantParser(path).data, GeoCroissantParser(path).data)
+
+    def _assert_peek_matches_parser(self):
+        """Check peek() on a file against the full parser."""
+        path = self._write_temp_file(self.sample_data)
+        summary = GeoCroissantParser.peek(path)
+        parser = GeoCroissantParser(path)
+
+        self.assertEqual(summary["name"], parser.get_name())
+        self.assertEqual(summary["version"], parser.get_version())
+        self.assertEqual(summary["license"], parser.get_license())
+        self.assertEqual(summary["geocr:BoundingBox"], parser.get_bounding_box())
+        self.assertEqual(summary["geocr:temporalExtent"], parser.get_temporal_extent())
+
+    @unittest.skipIf(importlib.util.find_spec("ijson") is None, "ijson not installed")
+    def test_peek_streaming(self):
+        """Test that streaming peek() matches the full parser."""
+        self._assert_peek_matches_parser()
+
+    def test_peek_full_parse(self):
+        """Test that peek() without ijson matches the full parser."""
+        with mock.patch.object(geocroissant_parser, "ijson", None):
+            self._assert_peek_matches_parser()
+
+    def test_get_item_files(self):
+        """Test getting all distribution files of an item."""
+        files = self.parser.get_item_files("tile_001")
+        self.assertEqual([f["@id"] for f in files], ["tile_001/cog", "tile_001/csv"])
+        self.assertEqual(self.parser.get_item_files("missing"), [])
+
+    def test_find_distribution_file_by_role(self):
+        """Test finding files typed only by their @id role."""
+        data = dict(self.sample_data)
+        data["distribution"] = [
+            {
+                "@type": "cr:FileObject",
+                "@id": "tile_003/training_data_csv",
+                "contentUrl": "https://example.com/download?id=3",
+            },
+        ]
+        parser = GeoCroissantParser.from_dict(data)
+        self.assertEqual(
+            parser._get_file_index()[("tile_003", "csv")]["@id"],
+            "tile_003/training_data_csv",
+        )
+        self.assertIsNotNone(parser.find_distribution_file("tile_003", "csv"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,6 +3,18 @@
 Utils module for GeoCroissant Tools plugin.
 """
 
-from .gui_utils import get_icon, get_ui_file_path
+from .gui_utils import (
+    clear_icon_cache,
+    get_icon,
+    get_ui_file_path,
+    prewarm_icons,
+    refresh_icon_listing,
+)
 
-__all__ = ["get_icon", "get_ui_file_path"]
+__all__ = [
+    "clear_icon_cache",
+    "get_icon",
+    "get_ui_file_path",
+    "prewarm_icons",
+    "refresh_icon_listing",
+]
@@ -6,38 +6,155 @@ Provides helper functions for loading icons and UI files.
 """
 
 import os
-from qgis.PyQt.QtGui import QIcon
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, FrozenSet, Optional
 
+from qgis.PyQt.QtCore import QCoreApplication
 
-def get_icon(icon_name: str) -> QIcon:
+if TYPE_CHECKING:
+    from qgis.PyQt.QtGui import QIcon
+
+# Normalized once so lookups don't rebuild or re-resolve ".." per call
+_GUI_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "gui")
+)
+_IMG_DIR = os.path.join(_GUI_DIR, "img")
+
+# Directory prefixes that file names are appended to
+_GUI_PREFIX = _GUI_DIR + os.sep
+_IMG_PREFIX = _IMG_DIR + os.sep
+
+# File names in _IMG_DIR, listed on first icon lookup
+_img_files: Optional[FrozenSet[str]] = None
+
+
+def _img_listing() -> FrozenSet[str]:
+    """
+    Return the image directory listing, reading it on first use.
+
+    :returns: File names in the image directory
+    """
+    global _img_files
+    if _img_files is None:
+        try:
+            # DirEntry.is_file() uses the type readdir already returned
+            with os.scandir(_IMG_DIR) as entries:
+                _img_files = frozenset(e.name for e in entries if e.is_file())
+        except OSError:
+            _img_files = frozenset()
+    return _img_files
+
+
+# Extensions get_icon falls back to for names without one
+_ICON_EXTENSIONS = (".svg", ".png")
+
+# Loaded icons keyed by their file name in _IMG_DIR
+_icon_cache: Dict[str, "QIcon"] = {}
+
+# Null icon shared by every failed lookup, created on first use
+_empty_icon: Optional["QIcon"] = None
+
+
+def _get_empty_icon() -> "QIcon":
+    """
+    Return the shared empty icon.
+
+    :returns: Null QIcon
+    """
+    global _empty_icon
+    if _empty_icon is None:
+        from qgis.PyQt.QtGui import QIcon
+
+        _empty_icon = QIcon()
+    return _empty_icon
+
+
+def get_icon(icon_name: str) -> "QIcon":
     """
     Returns a plugin icon.
 
-    :param icon_name: Icon file name (e.g., "icon_geocroissant.png")
+    Icons are loaded once per image file and shared across calls and
+    dialog instances. Prefer passing the full file name, which resolves
+    without trying any other extension.
+
+    :param icon_name: Icon file name (e.g., "icon_help.svg"); names without
+        an extension try the .svg and .png variants
+    :returns: QIcon object
+    """
+    # Icons can't be created before the application exists; don't cache that
+    if QCoreApplication.instance() is None:
+        return _get_empty_icon()
+
+    # Common case: the caller passed the exact name of an existing file
+    if icon_name in _img_listing():
+        return _icon_file(icon_name)
+
+    file_name = _canonicalize(icon_name)
+    if file_name is None:
+        return _get_empty_icon()
+    return _icon_file(file_name)
+
+
+@lru_cache(maxsize=None)
+def _canonicalize(icon_name: str) -> Optional[str]:
+    """
+    Resolve an icon name to the image file it refers to.
+
+    Misses are cached as well, so a name with no matching file costs one
+    lookup on every later call until refresh_icon_listing().
+
+    :param icon_name: Icon file name, with or without extension
+    :returns: File name in the image directory, or None if none matches
+    """
+    img_files = _img_listing()
+
+    # An explicit extension is taken as is; bare names try each icon type
+    name_without_ext, ext = os.path.splitext(icon_name)
+    for candidate_ext in (ext,) if ext else _ICON_EXTENSIONS:
+        candidate = f"{name_without_ext}{candidate_ext}"
+        if candidate in img_files:
+            return candidate
+    return None
+
+
+def _icon_file(file_name: str) -> "QIcon":
+    """
+    Return the icon for an image file, loading it on first use.
+
+    :param file_name: File name in the image directory
     :returns: QIcon object
     """
-    base_dir = os.path.join(os.path.dirname(__file__), "..", "gui", "img")
+    icon = _icon_cache.get(file_name)
+    if icon is None:
+        # QtGui is only imported once an icon is actually needed
+        from qgis.PyQt.QtGui import QIcon
+
+        icon = _icon_cache[file_name] = QIcon(_IMG_PREFIX + file_name)
+    return icon
+
 
-    # Try the exact filename first
-    path = os.path.join(base_dir, icon_name)
-    if os.path.exists(path):
-        return QIcon(path)
+def prewarm_icons() -> None:
+    """Load every plugin icon up front, e.g. while the plugin GUI is set up."""
+    if QCoreApplication.instance() is None:
+        return
+    for file_name in _img_listing():
+        _icon_file(file_name)
 
-    # Try with .svg extension if not found
-    name_without_ext = os.path.splitext(icon_name)[0]
-    svg_path = os.path.join(base_dir, f"{name_without_ext}.svg")
-    if os.path.exists(svg_path):
-        return QIcon(svg_path)
 
-    # Try with .png extension
-    png_path = os.path.join(base_dir, f"{name_without_ext}.png")
-    if os.path.exists(png_path):
-        return QIcon(png_path)
+def clear_icon_cache() -> None:
+    """Release the cached icons, e.g. when the plugin is unloaded."""
+    _icon_cache.clear()
 
-    # Return empty icon if file doesn't exist
-    return QIcon()
 
+def refresh_icon_listing() -> None:
+    """Re-read the image directory on the next lookup and drop cached icons."""
+    global _img_files
+    _img_files = None
+    _canonicalize.cache_clear()
+    clear_icon_cache()
 
+
+@lru_cache(maxsize=64)
 def get_ui_file_path(file_name: str) -> str:
     """
     Returns the full path to a UI file.
@@ -45,6 +162,4 @@ def get_ui_file_path(file_name: str) -> str:
     :param file_name: UI file name (e.g., "main_dialog.ui")
     :returns: Full path to the UI file
     """
-    path = os.path.join(os.path.dirname(__file__), "..", "gui", file_name)
-
-    return path
+    return _GUI_PREFIX + file_name